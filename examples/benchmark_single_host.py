@@ -0,0 +1,73 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from pysilkit import SilKit, CanMessage
+from pysilkit.can_controller import TimestampMode
+
+# Compares the default loopback TCP transport with the single host mode,
+# every mode runs in its own process as participant names are unique per process
+
+def run(single_host, count, round_trips):
+    s = SilKit("Bench_Tx", "Bench_Rx", port=0, embedded_registry=True, single_host=single_host)
+    tx = s.add_participant("Bench_Tx")
+    tx.add_can_controller("Bench_Tx_CAN", timestamp_mode=TimestampMode.SIMULATION)
+    rx = s.add_participant("Bench_Rx")
+    rx.add_can_controller("Bench_Rx_CAN", rx_queue_size=count, timestamp_mode=TimestampMode.SIMULATION)
+    tx.can(0).start()
+    rx.can(0).start()
+    msg = CanMessage(0x700, *(1,2,3,4,5,6,7,8))
+    #Latency of a single frame until it is received by the peer
+    latencies = []
+    for _ in range(round_trips):
+        tmp = time.perf_counter_ns()
+        tx.can(0).send(msg)
+        rx.can(0).recv(timeout=1.0)
+        latencies.append(time.perf_counter_ns() - tmp)
+    #Throughput of a burst of frames
+    tmp = time.perf_counter()
+    futures = tx.can(0).send_many([msg] * count)
+    for _ in range(count):
+        rx.can(0).recv(timeout=5.0)
+    duration = time.perf_counter() - tmp
+    for future in futures:
+        future.result(5.0)
+    tx.can(0).stop()
+    rx.can(0).stop()
+    print(
+        f"{statistics.median(latencies) / 1e3:.1f} "
+        f"{statistics.quantiles(latencies, n=100)[98] / 1e3:.1f} "
+        f"{count / duration:.0f}"
+    )
+
+def compare(count, round_trips):
+    results = {}
+    for mode in ("tcp", "single-host"):
+        output = subprocess.run(
+            [
+                sys.executable, __file__,
+                "--mode", mode,
+                "--count", str(count),
+                "--round-trips", str(round_trips)
+            ],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[mode] = [float(value) for value in output.strip().splitlines()[-1].split()]
+    print(f"{'mode':<12} {'median us':>10} {'p99 us':>10} {'frames/s':>10}")
+    for mode, (median, p99, rate) in results.items():
+        print(f"{mode:<12} {median:>10.1f} {p99:>10.1f} {rate:>10.0f}")
+    tcp, local = results["tcp"], results["single-host"]
+    print(f"latency x{tcp[0] / local[0]:.2f}, throughput x{local[2] / tcp[2]:.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=("tcp", "single-host"))
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--round-trips", type=int, default=1000)
+    args = parser.parse_args()
+    if args.mode is None:
+        compare(args.count, args.round_trips)
+    else:
+        run(args.mode == "single-host", args.count, args.round_trips)
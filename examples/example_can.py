@@ -4,7 +4,7 @@ from pysilkit import SilKit, SilKitParticipant, CanMessage
 if __name__ == "__main__":
     s = SilKit("Test1", "Test2")
     p = SilKitParticipant("Test1")
-    p.add_can_controller("Test1_CAN")
+    p.add_can_controller("Test1_CAN", tx_queue_size=100)
     p2 = SilKitParticipant("Test2")
     p2.add_can_controller("Test2_CAN")
     p.can(0).start()
@@ -14,8 +14,9 @@ if __name__ == "__main__":
         *(1,2,3,4,5,6,7,8),
     )
     print(msg)
-    p.can(0).send(msg)
-    print("SENT", p.can(0).wait_tx_ack(msg))
+    tx = p.can(0).send(msg)
+    print("SENT", p.can(0).wait_tx_ack(tx))
+    p.can(0).recv_tx_ack(1.0)#The acknowledgement is queued as well
     d = p2.can(0).recv()
     print("RECV", d)
     msg = CanMessage(
@@ -25,7 +26,7 @@ if __name__ == "__main__":
     p.can(0).send(msg)
     time.sleep(0.1)#Wait for ack
     d = p2.can(0).recv()
-    print("SENT", p.can(0).recv())
+    print("SENT", p.can(0).recv_tx_ack())
     print("RECV", d)
     msg = CanMessage(
         0x702,
@@ -34,7 +35,7 @@ if __name__ == "__main__":
     p.can(0).send(msg)
     time.sleep(0.1)#Wait for ack
     d = p2.can(0).recv()
-    print("SENT", p.can(0).recv())
+    print("SENT", p.can(0).recv_tx_ack())
     print("RECV", d)
     msg = CanMessage(
         0x703,
@@ -43,7 +44,7 @@ if __name__ == "__main__":
     p.can(0).send(msg)
     time.sleep(0.1)#Wait for ack
     d = p2.can(0).recv()
-    print("SENT", p.can(0).recv())
+    print("SENT", p.can(0).recv_tx_ack())
     print("RECV", d)
     p.can(0).sleep()
     p.can(0).reset()
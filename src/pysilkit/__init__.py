@@ -1,3 +1,24 @@
-from .silkit import SilKit
-from .participant import SilKitParticipant
-from .can_controller import CanMessage
+import importlib
+
+# The exports are imported on first access, so a script that only parses
+# CanMessages does not pay for the orchestration and its subprocesses
+_exports_ = {
+    "SilKit": ".silkit",
+    "SilKitParticipant": ".participant",
+    "ParticipantConfiguration": ".configuration",
+    "CanMessage": ".can_controller",
+}
+
+__all__ = list(_exports_)
+
+def __getattr__(name):
+    try:
+        module = _exports_[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports_))
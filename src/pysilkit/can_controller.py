@@ -1,21 +1,59 @@
-import collections
 import ctypes
-from datetime import datetime, timezone
+import enum
+import itertools
+import threading
 import time
 
 from .library import silkitapi
 from .utilities import py2ct, auto_context
-
-from .time_slave import SilKitTimeSlave
+from .message_queue import MessageQueue, OverflowPolicy
 
 GLOBAL_TIME = time.perf_counter()
 
+class TimestampMode(enum.IntEnum):
+    TIME_SLAVE = 0 # Wall clock time interpolated from the time master's sync messages
+    SIMULATION = 1 # Native SilKit time of the event (nanoseconds since simulation start)
+    SIMULATION_SINCE_BOOT = 2 # Native SilKit time of the event offset by the time master's boot date
+
+_RTR = int(silkitapi.SilKitCanFrameFlag.RTR)
+_FDF = int(silkitapi.SilKitCanFrameFlag.FDF)
+_BRS = int(silkitapi.SilKitCanFrameFlag.BRS)
+_ESI = int(silkitapi.SilKitCanFrameFlag.ESI)
+_XLF = int(silkitapi.SilKitCanFrameFlag.XLF)
+
+def _flag_property(flag):
+    def getter(self):
+        return bool(self.flags & flag)
+    def setter(self, value):
+        if value:
+            self.flags |= flag
+        else:
+            self.flags &= ~flag
+    return property(getter, setter)
+
 class CanMessage(object):
+    # Two messages are created per frame (receive and transmit ack), so keep
+    # them compact: no instance dict, flags packed like SilKitCanFrameFlag
+    # and the payload stored as bytes
+    __slots__ = (
+        "id",
+        "flags",
+        "is_rx_fame",
+        "dlc",
+        "sdt",
+        "vcid",
+        "af",
+        "data",
+        "timestamp",
+        "_frame",
+        "_frame_key",
+    )
+
     def __init__(
             self,
             id,
             *data,
-            timestamp = 0.0,
+            timestamp = 0, # nanoseconds
             is_can_fd = False,
             is_can_xl = False,
             is_remote_frame = False,
@@ -27,49 +65,139 @@ class CanMessage(object):
             vcid = 0,
             af = 0
     ):
+        if len(data) == 1 and isinstance(data[0], (bytes, bytearray, memoryview)):
+            data = bytes(data[0])
+        else:
+            data = bytes(data)
+        flags = 0
+        if is_remote_frame:
+            flags |= _RTR
+        if is_can_fd:
+            flags |= _FDF
+        if bitrate_switch:
+            flags |= _BRS
+        if error_state_indicator:
+            flags |= _ESI
+        if is_can_xl:
+            flags |= _XLF
+        # if self.todo:
+        #     flags |= silkitapi.SilKitCanFrameFlag.SEC
         self.id = id
-        self.is_can_fd = is_can_fd
-        self.is_can_xl = is_can_xl
-        self.is_remote_frame = is_remote_frame
+        self.flags = flags
         self.is_rx_fame = is_rx_fame
-        self.bitrate_switch = bitrate_switch
-        self.error_state_indicator = error_state_indicator
         self.dlc = len(data)
         self.sdt = sdt # service data unit (CiA611-1: SDT=0x05 is Ethernet Frame)
         self.vcid = vcid # Virtual Can Network id
         self.af = af # acceptance field / Can ID for XL
         self.data = data
         self.timestamp = timestamp
+        self._frame = None
+        self._frame_key = None
+
+    is_remote_frame = _flag_property(_RTR)
+    is_can_fd = _flag_property(_FDF)
+    bitrate_switch = _flag_property(_BRS)
+    error_state_indicator = _flag_property(_ESI)
+    is_can_xl = _flag_property(_XLF)
+
+    @property
+    def timestamp_s(self):
+        return self.timestamp * 1e-9
+
+    @property
+    def datetime(self):
+        #Imported on use, parsing messages does not need datetime
+        from datetime import datetime, timezone
+        return datetime.fromtimestamp(self.timestamp // 1_000_000_000, tz=timezone.utc).replace(
+            microsecond=self.timestamp % 1_000_000_000 // 1000
+        )
+
+    @classmethod
+    def from_silkit(cls, can_frame, timestamp, is_rx_fame):
+        # Fast path for the receive handlers, skips the keyword handling of __init__
+        msg = cls.__new__(cls)
+        msg.id = can_frame.id
+        msg.flags = can_frame.flags
+        msg.is_rx_fame = is_rx_fame
+        msg.data = can_frame.data.to_bytes()
+        msg.dlc = len(msg.data)
+        msg.sdt = can_frame.sdt
+        msg.vcid = can_frame.vcid
+        msg.af = can_frame.af
+        msg.timestamp = timestamp
+        msg._frame = None
+        msg._frame_key = None
+        return msg
 
     def __str__(self):
-        tmp = datetime.fromtimestamp(self.timestamp, tz=timezone.utc).strftime("%d/%m/%Y %H:%M:%S.%f")
-        # tmp = self.timestamp
-        return f"{tmp} 0x{self.id:02X}: {self.data}"
+        from datetime import datetime, timezone
+        seconds, nanoseconds = divmod(self.timestamp, 1_000_000_000)
+        tmp = datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%d/%m/%Y %H:%M:%S")
+        tmp = f"{tmp}.{nanoseconds:09d}"
+        return f"{tmp} 0x{self.id:02X}: {self.data.hex(' ').upper()}"
 
     def to_silkit(self):
-        flags = 0
-        if self.is_remote_frame:
-            flags |= silkitapi.SilKitCanFrameFlag.RTR
-        if self.is_can_fd:
-            flags |= silkitapi.SilKitCanFrameFlag.FDF
-        if self.bitrate_switch:
-            flags |= silkitapi.SilKitCanFrameFlag.BRS
-        if self.error_state_indicator:
-            flags |= silkitapi.SilKitCanFrameFlag.ESI
-        if self.is_can_xl:
-            flags |= silkitapi.SilKitCanFrameFlag.XLF
-        # if self.todo:
-        #     flags |= silkitapi.SilKitCanFrameFlag.SEC
-        return silkitapi.SilKit_CanFrame(
-            structHeader=silkitapi.SilKit_StructHeader(version=silkitapi.SilKit_STRUCT_VERSION.CanFrame),
-            id=self.id,
-            flags=flags,
-            dlc=self.dlc,
-            sdt=self.sdt,
-            vcid=self.vcid,
-            af=self.af,
-            data= silkitapi.SilKit_ByteVector.from_sequence(self.data)
-        )
+        # The native frame (and the payload it points to) is cached and only
+        # rebuilt when one of the fields it was built from has changed, so
+        # periodically re-sent messages pay the conversion once
+        key = (self.id, self.flags, self.dlc, self.sdt, self.vcid, self.af, self.data)
+        if self._frame is None or self._frame_key != key:
+            self._frame = silkitapi.SilKit_CanFrame(
+                structHeader=silkitapi.SilKit_StructHeader(version=silkitapi.SilKit_STRUCT_VERSION.CanFrame),
+                id=self.id,
+                flags=self.flags,
+                dlc=self.dlc,
+                sdt=self.sdt,
+                vcid=self.vcid,
+                af=self.af,
+                data= silkitapi.SilKit_ByteVector.from_buffer(self.data)
+            )
+            self._frame_key = key
+        return self._frame
+
+class CanTransmitFuture(object):
+    # Resolved by the transmit handler of the controller, all futures of a
+    # controller share its condition instead of allocating an event each
+    __slots__ = (
+        "user_context",
+        "message",
+        "status",
+        "ack",
+        "_frame",
+        "_storage",
+        "_condition",
+    )
+
+    def __init__(self, user_context, message, frame, condition, storage = None):
+        self.user_context = user_context
+        self.message = message
+        self.status = None
+        self.ack = None
+        self._frame = frame
+        self._storage = storage
+        self._condition = condition
+
+    def done(self):
+        return self.status is not None
+
+    def result(self, timeout: float = None):
+        # timeout=None blocks until the transmit event arrived
+        if self.status is None:
+            with self._condition:
+                self._condition.wait_for(self.done, timeout)
+        if self.status is None:
+            raise silkitapi.SilKitError(
+                silkitapi.SiKitReturnCode.TIMEOUT,
+                f"No transmit acknowledgement for 0x{self.message.id:02X} within {timeout}s",
+                self.result.__name__
+            )
+        if self.status != silkitapi.SilKitCanTransmitStatus.TRANSMITTED:
+            raise silkitapi.SilKitError(
+                self.status,
+                f"Transmission of 0x{self.message.id:02X} failed",
+                self.result.__name__
+            )
+        return self.ack
 
 class SilKitCanController(object):
     @silkitapi.SilKit_CanStateChangeHandler_t
@@ -92,48 +220,39 @@ class SilKitCanController(object):
     @staticmethod
     @auto_context
     def on_transmit(self, controller, event):
-        timestamp = self.time_slave.get_timestamp()
+        future = self._pending_tx.pop(event.contents.userContext, None)
+        if future is None:
+            return
+        if self.time_slave is None:
+            timestamp = event.contents.timestamp + self._timestamp_offset_
+        else:
+            timestamp = self.time_slave.get_timestamp()
         transmission_status = silkitapi.SilKitCanTransmitStatus(event.contents.status)
+        msg = None
         if transmission_status == silkitapi.SilKitCanTransmitStatus.TRANSMITTED:
-            can_frame = ctypes.cast(event.contents.userContext, silkitapi.SilKit_CanFrame_p).contents
-            msg = CanMessage(
-                can_frame.id,
-                *can_frame.data.to_sequence(),
-                is_can_fd=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.FDF),
-                is_can_xl=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.XLF),
-                timestamp=timestamp,
-                is_remote_frame=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.RTR),
-                is_rx_fame=False,
-                bitrate_switch=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.BRS),
-                error_state_indicator=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.ESI),
-                sdt=can_frame.sdt,
-                vcid=can_frame.vcid,
-                af=can_frame.af
-            )
-            self.rx_queue.append(msg)
+            msg = CanMessage.from_silkit(future._frame, timestamp, False)
+        #The future is resolved first, a full tx queue must not hold it back
+        with self._tx_condition:
+            future.ack = msg
+            future.status = transmission_status
+            future._frame = future._storage = None
+            self._tx_condition.notify_all()
+        if msg is not None and self.tx_queue is not None:
+            self.tx_queue.put(msg)
 
     @silkitapi.SilKit_CanFrameHandler_t
     @staticmethod
     @auto_context
     def on_msg(self, controller, event):
-        self.participant.info("Recv Message") #Log something
-        timestamp = self.time_slave.get_timestamp()
+        if self.time_slave is None:
+            timestamp = event.contents.timestamp + self._timestamp_offset_
+        else:
+            timestamp = self.time_slave.get_timestamp()
         can_frame = event.contents.frame.contents
-        msg = CanMessage(
-            can_frame.id,
-            *can_frame.data.to_sequence(),
-            is_can_fd=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.FDF),
-            is_can_xl=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.XLF),
-            timestamp=timestamp,
-            is_remote_frame=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.RTR),
-            is_rx_fame=True,
-            bitrate_switch=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.BRS),
-            error_state_indicator=bool(can_frame.flags & silkitapi.SilKitCanFrameFlag.ESI),
-            sdt=can_frame.sdt,
-            vcid=can_frame.vcid,
-            af=can_frame.af
-        )
-        self.rx_queue.append(msg)
+        msg = CanMessage.from_silkit(can_frame, timestamp, True)
+        self.rx_queue.put(msg)
+        if self.trace_frames:
+            self.participant.trace(f"[{self.name}] Recv {msg}")
 
     def __init__(
         self,
@@ -141,11 +260,17 @@ class SilKitCanController(object):
         name: str = None,
         network_name: str = "VIRTUAL",
         rx_queue_size: int = 2000,
+        tx_queue_size: int = 0,
+        rx_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        tx_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
         bitrate: int  = 500000,
         bitrate_fd: int  = 2000000,
         bitrate_xl: int  = 10000000,
+        timestamp_mode: TimestampMode = TimestampMode.TIME_SLAVE,
     ):
         self.participant = participant
+        #Per frame diagnostics are only produced if the logger traces anyway
+        self.trace_frames = participant.is_enabled_for(silkitapi.SilKitLoggingLevel.TRACE)
         if name is None:
             self.name = f"{participant.name}_can_{len(participant._can_controllers)}"
         else:
@@ -159,12 +284,29 @@ class SilKitCanController(object):
             name.encode(),
             network_name.encode()
         )
+        silkitapi.register_owner(self.instance, f"{participant.name}/{self.name}", participant.instance)
         #Create the context
-        self.rx_queue = collections.deque(maxlen=rx_queue_size)
+        #Received frames and transmit acknowledgements are queued separately
+        self.rx_queue = MessageQueue(rx_queue_size, rx_overflow)
+        #Acknowledgements are only queued for recv_tx_ack if tx_queue_size > 0,
+        #the futures returned by send do not need the queue
+        self.tx_queue = MessageQueue(tx_queue_size, tx_overflow) if tx_queue_size else None
+        # Futures of the frames in flight, keyed by the userContext passed to SendFrame
+        self._pending_tx = {}
+        self._tx_condition = threading.Condition()
+        self._user_contexts = itertools.count(1)
         self.state = None
         self.error_state = None
-        #Create the Subscriber to sync with the time master
-        self.time_slave = SilKitTimeSlave(self.participant, self.name)
+        #Share the participant's subscriber to sync with the time master,
+        #the simulation time modes stamp frames with the event's time instead
+        self.timestamp_mode = TimestampMode(timestamp_mode)
+        self._timestamp_offset_ = 0
+        if self.timestamp_mode == TimestampMode.TIME_SLAVE:
+            self.time_slave = participant.time_slave
+        else:
+            self.time_slave = None
+            if self.timestamp_mode == TimestampMode.SIMULATION_SINCE_BOOT:
+                self._timestamp_offset_ = participant.time_slave.master_boot_date
         #Wrap self into ctypes
         self.__self = py2ct(self)
         self.set_bitrate(bitrate, bitrate_fd, bitrate_xl)
@@ -227,24 +369,99 @@ class SilKitCanController(object):
 
     def send(self, message: CanMessage):
         can_frame = message.to_silkit()
-        silkitapi.SilKit_CanController_SendFrame(self.instance, ctypes.byref(can_frame), ctypes.byref(can_frame))
+        user_context = next(self._user_contexts)
+        future = CanTransmitFuture(user_context, message, can_frame, self._tx_condition)
+        self._pending_tx[user_context] = future
+        try:
+            silkitapi.SilKit_CanController_SendFrame(self.instance, ctypes.byref(can_frame), user_context)
+        except silkitapi.SilKitError:
+            self._pending_tx.pop(user_context, None)
+            raise
+        return future
 
-    def recv(self):
+    def send_many(self, messages):
+        # Copies a whole batch into one contiguous array of SilKit_CanFrame
+        # and one payload buffer, then hands the frames to SilKit in a tight
+        # loop. Returns a CanTransmitFuture per frame.
+        messages = list(messages)
+        count = len(messages)
+        if count == 0:
+            return []
+        payload = b"".join([message.data for message in messages])
+        storage = (ctypes.c_ubyte * len(payload)).from_buffer_copy(payload)
+        frames = (silkitapi.SilKit_CanFrame * count)()
+        version = silkitapi.SilKit_STRUCT_VERSION.CanFrame
+        u8_p = ctypes.POINTER(ctypes.c_ubyte)
+        storage_address = ctypes.addressof(storage)
+        condition = self._tx_condition
+        pending_tx = self._pending_tx
+        user_contexts = self._user_contexts
+        futures = []
+        offset = 0
+        for frame, message in zip(frames, messages):
+            frame.structHeader.version = version
+            frame.id = message.id
+            frame.flags = message.flags
+            frame.dlc = message.dlc
+            frame.sdt = message.sdt
+            frame.vcid = message.vcid
+            frame.af = message.af
+            frame.data.data = ctypes.cast(storage_address + offset, u8_p)
+            frame.data.size = len(message.data)
+            offset += len(message.data)
+            future = CanTransmitFuture(next(user_contexts), message, frame, condition, storage)
+            pending_tx[future.user_context] = future
+            futures.append(future)
+        frame_size = ctypes.sizeof(silkitapi.SilKit_CanFrame)
+        send_frame = silkitapi.SilKit_CanController_SendFrame
+        instance = self.instance
+        byref = ctypes.byref
+        for i in range(count):
+            try:
+                send_frame(instance, byref(frames, i * frame_size), futures[i].user_context)
+            except silkitapi.SilKitError:
+                for future in futures[i:]:
+                    pending_tx.pop(future.user_context, None)
+                raise
+        return futures
+
+    def _get_(self, queue, label, timeout, function_name):
         try:
-            return self.rx_queue.popleft()
+            return queue.get(timeout)
         except IndexError as error:
+            if timeout == 0:
+                raise silkitapi.SilKitError(
+                    -1,
+                    f"{label} queue of {self.name} is emtpy!",
+                    function_name
+                ) from error
             raise silkitapi.SilKitError(
-                -1,
-                f"Rx queue of {self.name} is emtpy!",
-                self.recv.__name__
+                silkitapi.SiKitReturnCode.TIMEOUT,
+                f"No message received by {self.name} within {timeout}s",
+                function_name
             ) from error
 
-    def wait_tx_ack(self, message):
-        while True:
-            try:
-                msg = self.recv()
-            except silkitapi.SilKitError:
-                pass
-            else:
-                if msg.id == message.id:
-                    return msg
\ No newline at end of file
+    def recv(self, timeout: float = 0.0):
+        # timeout=0 polls, timeout=None blocks until a message arrives
+        return self._get_(self.rx_queue, "Rx", timeout, self.recv.__name__)
+
+    def recv_tx_ack(self, timeout: float = 0.0):
+        if self.tx_queue is None:
+            raise silkitapi.SilKitError(
+                -1,
+                f"Tx queue of {self.name} is disabled, create the controller with tx_queue_size > 0",
+                self.recv_tx_ack.__name__
+            )
+        return self._get_(self.tx_queue, "Tx", timeout, self.recv_tx_ack.__name__)
+
+    def queue_stats(self):
+        return {
+            "rx": self.rx_queue.stats(),
+            "tx": None if self.tx_queue is None else self.tx_queue.stats()
+        }
+
+    def wait_tx_ack(self, transmission: CanTransmitFuture, timeout: float = None):
+        # Raises SiKitReturnCode.TIMEOUT if no acknowledgement arrives in time
+        if not isinstance(transmission, CanTransmitFuture):
+            raise ValueError(f"Parameter transmission must be the {CanTransmitFuture.__name__} returned by send")
+        return transmission.result(timeout)
@@ -0,0 +1,158 @@
+import enum
+
+from typing import Optional
+
+from .library import silkitapi
+
+class SinkType(enum.IntEnum):
+    STDOUT = 0
+    FILE = 1
+    REMOTE = 2
+
+class LogSink(object):
+    def __init__(
+        self,
+        sink_type: SinkType = SinkType.FILE,
+        level: silkitapi.SilKitLoggingLevel = silkitapi.SilKitLoggingLevel.INFO,
+        log_name: str = "Log_"
+    ):
+        self.sink_type = SinkType(sink_type)
+        self.level = silkitapi.SilKitLoggingLevel(level)
+        self.log_name = log_name
+
+    def _to_yaml_(self):
+        lines = [
+            f"  - Type: {self.sink_type.name.capitalize()}",
+            f"    Level: {self.level.name.capitalize()}",
+        ]
+        if self.sink_type == SinkType.FILE:
+            lines.append(f"    LogName: {self.log_name}")
+        return lines
+
+class ParticipantConfiguration(object):
+    # Middleware and logging options of a participant, rendered into the
+    # YAML accepted by SilKit_ParticipantConfiguration_FromString.
+    # Options set to None are left out so SilKit uses its own default.
+    def __init__(
+        self,
+        *,
+        sinks = None,
+        log_level: silkitapi.SilKitLoggingLevel = silkitapi.SilKitLoggingLevel.INFO,
+        flush_level: Optional[silkitapi.SilKitLoggingLevel] = None,
+        log_from_remotes: bool = False,
+        soft_response_timeout: Optional[int] = 500, # milliseconds
+        hard_response_timeout: Optional[int] = 5000, # milliseconds
+        connect_attempts: Optional[int] = 9,
+        connect_timeout: Optional[float] = 1.234, # seconds
+        tcp_no_delay: Optional[bool] = True,
+        tcp_quick_ack: Optional[bool] = True,
+        tcp_send_buffer_size: Optional[int] = None, # bytes
+        tcp_receive_buffer_size: Optional[int] = None, # bytes
+        enable_domain_sockets: Optional[bool] = False,
+        registry_as_fallback_proxy: Optional[bool] = False
+    ):
+        #Without explicit sinks a single file sink logs at log_level
+        self.sinks = [LogSink(SinkType.FILE, log_level)] if sinks is None else list(sinks)
+        #Flush everything the sinks log unless set explicitly
+        self.flush_level = self.log_level if flush_level is None else flush_level
+        self.log_from_remotes = log_from_remotes
+        self.soft_response_timeout = soft_response_timeout
+        self.hard_response_timeout = hard_response_timeout
+        self.connect_attempts = connect_attempts
+        self.connect_timeout = connect_timeout
+        self.tcp_no_delay = tcp_no_delay
+        self.tcp_quick_ack = tcp_quick_ack
+        self.tcp_send_buffer_size = tcp_send_buffer_size
+        self.tcp_receive_buffer_size = tcp_receive_buffer_size
+        self.enable_domain_sockets = enable_domain_sockets
+        self.registry_as_fallback_proxy = registry_as_fallback_proxy
+
+    @classmethod
+    def throughput(cls, **kwargs):
+        # Large socket buffers and Nagle's algorithm batch small frames into
+        # few segments, logging is limited to warnings
+        options = dict(
+            log_level=silkitapi.SilKitLoggingLevel.WARN,
+            tcp_no_delay=False,
+            tcp_quick_ack=False,
+            tcp_send_buffer_size=4 * 1024 * 1024,
+            tcp_receive_buffer_size=4 * 1024 * 1024,
+            enable_domain_sockets=True
+        )
+        options.update(kwargs)
+        return cls(**options)
+
+    @classmethod
+    def low_latency(cls, **kwargs):
+        # Every frame is sent and acknowledged immediately, buffers are kept
+        # moderate so frames do not queue up behind a backlog
+        options = dict(
+            log_level=silkitapi.SilKitLoggingLevel.WARN,
+            tcp_no_delay=True,
+            tcp_quick_ack=True,
+            tcp_send_buffer_size=256 * 1024,
+            tcp_receive_buffer_size=256 * 1024,
+            enable_domain_sockets=True
+        )
+        options.update(kwargs)
+        return cls(**options)
+
+    @classmethod
+    def single_host(cls, **kwargs):
+        # All participants run on this host: compared to the defaults the
+        # peers connect over domain sockets instead of loopback TCP and the
+        # socket buffers are sized for local bursts, logging is limited to
+        # warnings
+        options = dict(
+            log_level=silkitapi.SilKitLoggingLevel.WARN,
+            tcp_send_buffer_size=1024 * 1024,
+            tcp_receive_buffer_size=1024 * 1024,
+            enable_domain_sockets=True
+        )
+        options.update(kwargs)
+        return cls(**options)
+
+    @property
+    def log_level(self):
+        # The most verbose level of all sinks
+        levels = [sink.level for sink in self.sinks if sink.level != silkitapi.SilKitLoggingLevel.OFF]
+        return min(levels, default=silkitapi.SilKitLoggingLevel.OFF)
+
+    def to_yaml(self, name: str, registry_uri: str):
+        lines = [
+            "---",
+            f"Description: Configuration of {name}",
+            "SchemaVersion: 1",
+            f"ParticipantName: {name}",
+            "Logging:",
+            "  Sinks:",
+        ]
+        for sink in self.sinks:
+            lines.extend(sink._to_yaml_())
+        lines.append(f"  FlushLevel: {silkitapi.SilKitLoggingLevel(self.flush_level).name.capitalize()}")
+        lines.append(f"  LogFromRemotes: {_to_yaml_value_(self.log_from_remotes)}")
+        lines.extend(_to_yaml_section_("HealthCheck", [
+            ("SoftResponseTimeout", self.soft_response_timeout),
+            ("HardResponseTimeout", self.hard_response_timeout),
+        ]))
+        lines.extend(_to_yaml_section_("Middleware", [
+            ("RegistryUri", registry_uri),
+            ("ConnectAttempts", self.connect_attempts),
+            ("TcpNoDelay", self.tcp_no_delay),
+            ("TcpQuickAck", self.tcp_quick_ack),
+            ("EnableDomainSockets", self.enable_domain_sockets),
+            ("TcpSendBufferSize", self.tcp_send_buffer_size),
+            ("TcpReceiveBufferSize", self.tcp_receive_buffer_size),
+            ("RegistryAsFallbackProxy", self.registry_as_fallback_proxy),
+            ("ConnectTimeoutSeconds", self.connect_timeout),
+        ]))
+        return "\n".join(lines) + "\n"
+
+def _to_yaml_value_(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+def _to_yaml_section_(section, options):
+    lines = [f"  {key}: {_to_yaml_value_(value)}" for key, value in options if value is not None]
+    return [f"{section}:"] + lines if lines else []
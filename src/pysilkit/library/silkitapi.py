@@ -21,8 +21,9 @@
 
 import ctypes
 import enum
-import pathlib
+import os
 import sys
+import threading
 
 ###### Types.h ######
 
@@ -81,18 +82,56 @@ class SilKit_ByteVector(ctypes.Structure):
 
     @staticmethod
     def from_sequence(sequence):
-        length = len(sequence)
-        c_array = (ctypes.c_ubyte * length)(*sequence)
+        if isinstance(sequence, (bytes, bytearray, memoryview)):
+            return SilKit_ByteVector.from_buffer(sequence)
+        # Sequences of ints are converted in one go instead of element by element
+        return SilKit_ByteVector.from_buffer(bytes(sequence))
+
+    @staticmethod
+    def from_buffer(buffer):
+        # Points data directly at the memory of buffer without copying it.
+        # The owner is kept alive through the ctypes references of the vector
+        # (and of any structure it gets assigned to), a bytearray can not be
+        # resized while such a vector exists.
+        if isinstance(buffer, bytes):
+            return SilKit_ByteVector(
+                data = ctypes.cast(ctypes.c_char_p(buffer), ctypes.POINTER(ctypes.c_ubyte)),
+                size = len(buffer)
+            )
+        view = memoryview(buffer)
+        if not view.c_contiguous:
+            return SilKit_ByteVector.from_buffer(view.tobytes())
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        length = view.nbytes
+        if view.readonly:
+            # ctypes can only share writable memory, fall back to a single memcpy
+            c_array = (ctypes.c_ubyte * length).from_buffer_copy(view)
+        else:
+            c_array = (ctypes.c_ubyte * length).from_buffer(view)
         return SilKit_ByteVector(
             data = ctypes.cast(c_array, ctypes.POINTER(ctypes.c_ubyte)),
             size = length
         )
 
     def to_sequence(self):
-        return [self.data[i] for i in range(self.size)]
+        return list(self.to_bytes())
+
+    def to_bytes(self):
+        if not self.size:
+            return b""
+        return ctypes.string_at(self.data, self.size)
+
+    def to_memoryview(self):
+        # The view aliases native memory, it is only valid as long as the
+        # vector is (i.e. inside the callback that provided it)
+        if not self.size:
+            return memoryview(b"")
+        c_array = ctypes.cast(self.data, ctypes.POINTER(ctypes.c_ubyte * self.size)).contents
+        return memoryview(c_array).cast("B")
 
     def __str__(self):
-        tmp = ", ".join([f"0x{self.data[i]:02X}" for i in range(self.size)])
+        tmp = ", ".join([f"0x{byte:02X}" for byte in self.to_bytes()])
         return f"[{tmp}]"
 
 SilKit_LabelKind = ctypes.c_uint32
@@ -167,84 +206,200 @@ VERSION_SUFFIX = ""
 ###### Version.h ######
 
 class SilKitError(Exception):
-    def __init__(self, error_code, error_text, function_name):
-        super(SilKitError, self).__init__(
-            f"Error {error_code}: {function_name} failed ({error_text})"
-        )
-        self._args = error_code, error_text, function_name
-        self.error_code, self.error_text, self.function_name = self._args
+    def __init__(self, error_code, error_text, function_name, arguments = None, owner = None):
+        message = f"Error {error_code}: {function_name} failed ({error_text})"
+        if owner is not None:
+            message = f"{message} on {owner}"
+        if arguments is not None:
+            message = f"{message}\n  called with ({', '.join(arguments)})"
+        super(SilKitError, self).__init__(message)
+        self._args = error_code, error_text, function_name, arguments, owner
+        self.error_code, self.error_text, self.function_name, self.arguments, self.owner = self._args
 
     def __reduce__(self):
         return type(self), self._args
 
-if sys.maxsize > 2**32:
-    __LIB_NAME = "SilKit64.dll"
+if sys.platform == "win32":
+    __LIB_NAME = "SilKit64.dll" if sys.maxsize > 2**32 else "SilKit.dll"
+    __LOADER = ctypes.windll
+elif sys.platform == "darwin":
+    __LIB_NAME = "libSilKit.dylib"
+    __LOADER = ctypes.cdll
 else:
-    __LIB_NAME = "SilKit.dll"
-
-__LOADER = ctypes.windll
-_file_path = pathlib.Path(__file__)
-lib_folder = _file_path.parent.resolve()
-__LOCAL_LIB = lib_folder / __LIB_NAME
-try:
-    _silkit_ = __LOADER.LoadLibrary(str(__LOCAL_LIB))
-except FileNotFoundError as load_error:
-    if getattr(sys, "frozen", False):
-        ERROR_TEXT = "Failed to load Vector SilKit. Ensure the .exe is bundled with the '--collect-data' option"
-    else:
-        ERROR_TEXT = "Failed to load Vector SilKit."
-    raise SilKitError(
-        -1,
-        ERROR_TEXT,
-        __LOADER.LoadLibrary.__name__
-    ) from load_error
+    __LIB_NAME = "libSilKit.so"
+    __LOADER = ctypes.cdll
+lib_folder = os.path.dirname(os.path.abspath(__file__))
+__LOCAL_LIB = os.path.join(lib_folder, __LIB_NAME)
+#Overrides the library search, a path to the SilKit shared library
+LIBRARY_ENV = "PYSILKIT_LIBRARY"
+_silkit_ = None
+_load_lock_ = threading.Lock()
+
+def _find_library_():
+    # Explicit path, then the bundled library, then the system search path
+    path = os.environ.get(LIBRARY_ENV)
+    if path:
+        return path
+    if os.path.exists(__LOCAL_LIB):
+        return __LOCAL_LIB
+    #ctypes.util pulls in subprocess, it is only needed for the system search
+    import ctypes.util
+    return ctypes.util.find_library("SilKit") or __LOCAL_LIB
+
+def _load_library_():
+    # The library is loaded on the first native call, not on import
+    global _silkit_
+    with _load_lock_:
+        if _silkit_ is not None:
+            return _silkit_
+        path = _find_library_()
+        try:
+            _silkit_ = __LOADER.LoadLibrary(path)
+        except OSError as load_error:
+            if getattr(sys, "frozen", False):
+                ERROR_TEXT = "Failed to load Vector SilKit. Ensure the .exe is bundled with the '--collect-data' option"
+            else:
+                ERROR_TEXT = f"Failed to load Vector SilKit from '{path}', set {LIBRARY_ENV} to the library path."
+            raise SilKitError(
+                -1,
+                ERROR_TEXT,
+                __LOADER.LoadLibrary.__name__
+            ) from load_error
+        return _silkit_
+
+#Function name -> (restype, argtypes, errcheck), bound on first access
+_prototypes_ = {}
+
+def _declare_(name, restype, argtypes, errcheck):
+    _prototypes_[name] = (restype, argtypes, errcheck)
+
+def _bind_(name, errcheck = True):
+    try:
+        restype, argtypes, check = _prototypes_[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    #Indexing returns a new function object, the unchecked set gets its own
+    function = _load_library_()[name]
+    function.restype = restype
+    function.argtypes = argtypes
+    if errcheck and check is not None:
+        function.errcheck = check
+    return function
+
+def __getattr__(name):
+    function = _bind_(name)
+    #Later lookups find the bound function directly
+    globals()[name] = function
+    return function
+
+class _UncheckedFunctions(object):
+    # The same prototypes without errcheck, the return code is returned as
+    # is. Only meant to measure the raw FFI overhead in benchmarks.
+    def __getattr__(self, name):
+        function = _bind_(name, errcheck=False)
+        setattr(self, name, function)
+        return function
+
+    def __dir__(self):
+        return sorted(_prototypes_)
+
+unchecked = _UncheckedFunctions()
+
+def __dir__():
+    return sorted(set(globals()) | set(_prototypes_))
+
+_SUCCESS_ = SiKitReturnCode.SUCCESS
 
 def check_silkit_status(res, fnc, args):
-    result = SiKitReturnCode(res)
-    if result != SiKitReturnCode.SUCCESS:
-        raise SilKitError(result, result.name, fnc.__name__)
-    return result
-
-SilKit_Version_Major = _silkit_.SilKit_Version_Major
-SilKit_Version_Major.restype = SilKit_ReturnCode
-SilKit_Version_Major.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-SilKit_Version_Major.errcheck = check_silkit_status
+    # Runs after every native call, success is a plain integer comparison
+    if res == 0:
+        return _SUCCESS_
+    _raise_silkit_error_(res, fnc, args)
+
+#Native handle address -> name of the participant or controller owning it,
+#only read to describe failed calls
+_owners_ = {}
+#Parent handle address -> addresses of the handles destroyed along with it,
+#i.e. the controllers and services of a participant
+_children_ = {}
+
+def register_owner(handle, owner: str, parent = None):
+    address = ctypes.cast(handle, ctypes.c_void_p).value
+    if address:
+        _owners_[address] = owner
+        if parent is not None:
+            _children_.setdefault(ctypes.cast(parent, ctypes.c_void_p).value, []).append(address)
+
+def unregister_owner(handle):
+    # Also drops the handles registered with this one as parent
+    address = ctypes.cast(handle, ctypes.c_void_p).value
+    _owners_.pop(address, None)
+    for child in _children_.pop(address, ()):
+        _owners_.pop(child, None)
+
+_CArgObject = type(ctypes.byref(ctypes.c_int()))
+
+def _describe_argument_(arg):
+    # Returns (text, owner) of an argument of a failed call
+    if isinstance(arg, _CArgObject):
+        arg = arg._obj
+        text, _ = _describe_argument_(arg)
+        return f"byref({text})", None
+    if isinstance(arg, ctypes._Pointer):
+        address = ctypes.cast(arg, ctypes.c_void_p).value
+        owner = _owners_.get(address)
+        if owner is None:
+            return f"{type(arg).__name__}({address and hex(address)})", None
+        return f"{type(arg).__name__}({hex(address)} of {owner})", owner
+    if isinstance(arg, ctypes.Structure):
+        return f"{type(arg).__name__}()", None
+    if isinstance(arg, ctypes._SimpleCData):
+        return f"{type(arg).__name__}({arg.value!r})", None
+    return repr(arg), None
+
+def _raise_silkit_error_(res, fnc, args):
+    # Only runs for failed calls, everything is collected here and not before
+    try:
+        result = SiKitReturnCode(res)
+        error_text = result.name
+    except ValueError:
+        result = res
+        text = ctypes.c_char_p()
+        if _bind_("SilKit_ReturnCodeToString", errcheck=False)(ctypes.byref(text), res) == 0 and text.value:
+            error_text = text.value.decode(errors="replace")
+        else:
+            error_text = "UNKNOWN_ERROR"
+    last_error = _bind_("SilKit_GetLastErrorString")()
+    if last_error:
+        error_text = f"{error_text}: {last_error.decode(errors='replace')}"
+    arguments = []
+    owner = None
+    for arg in args:
+        text, arg_owner = _describe_argument_(arg)
+        arguments.append(text)
+        if owner is None:
+            owner = arg_owner
+    raise SilKitError(result, error_text, fnc.__name__, arguments, owner)
+
+_declare_("SilKit_Version_Major", SilKit_ReturnCode, [ctypes.POINTER(ctypes.c_uint32)], check_silkit_status)
 SilKit_Version_Major_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.POINTER(ctypes.c_uint32))
 
-SilKit_Version_Minor = _silkit_.SilKit_Version_Minor
-SilKit_Version_Minor.restype = SilKit_ReturnCode
-SilKit_Version_Minor.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-SilKit_Version_Minor.errcheck = check_silkit_status
+_declare_("SilKit_Version_Minor", SilKit_ReturnCode, [ctypes.POINTER(ctypes.c_uint32)], check_silkit_status)
 SilKit_Version_Minor_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.POINTER(ctypes.c_uint32))
 
-SilKit_Version_Patch = _silkit_.SilKit_Version_Patch
-SilKit_Version_Patch.restype = SilKit_ReturnCode
-SilKit_Version_Patch.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-SilKit_Version_Patch.errcheck = check_silkit_status
+_declare_("SilKit_Version_Patch", SilKit_ReturnCode, [ctypes.POINTER(ctypes.c_uint32)], check_silkit_status)
 SilKit_Version_Patch_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.POINTER(ctypes.c_uint32))
 
-SilKit_Version_BuildNumber = _silkit_.SilKit_Version_BuildNumber
-SilKit_Version_BuildNumber.restype = SilKit_ReturnCode
-SilKit_Version_BuildNumber.argtypes = [ctypes.POINTER(ctypes.c_uint32)]
-SilKit_Version_BuildNumber.errcheck = check_silkit_status
+_declare_("SilKit_Version_BuildNumber", SilKit_ReturnCode, [ctypes.POINTER(ctypes.c_uint32)], check_silkit_status)
 SilKit_Version_BuildNumber_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.POINTER(ctypes.c_uint32))
 
-SilKit_Version_String = _silkit_.SilKit_Version_String
-SilKit_Version_String.restype = SilKit_ReturnCode
-SilKit_Version_String.argtypes = [ctypes.c_char_p]
-SilKit_Version_String.errcheck = check_silkit_status
+_declare_("SilKit_Version_String", SilKit_ReturnCode, [ctypes.c_char_p], check_silkit_status)
 SilKit_Version_String_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.c_char_p)
 
-SilKit_Version_VersionSuffix = _silkit_.SilKit_Version_VersionSuffix
-SilKit_Version_VersionSuffix.restype = SilKit_ReturnCode
-SilKit_Version_VersionSuffix.argtypes = [ctypes.c_char_p]
-SilKit_Version_VersionSuffix.errcheck = check_silkit_status
+_declare_("SilKit_Version_VersionSuffix", SilKit_ReturnCode, [ctypes.c_char_p], check_silkit_status)
 SilKit_Version_Suffix_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.c_char_p)
 
-SilKit_Version_GitHash = _silkit_.SilKit_Version_GitHash
-SilKit_Version_GitHash.restype = SilKit_ReturnCode
-SilKit_Version_GitHash.argtypes = [ctypes.c_char_p]
-SilKit_Version_GitHash.errcheck = check_silkit_status
+_declare_("SilKit_Version_GitHash", SilKit_ReturnCode, [ctypes.c_char_p], check_silkit_status)
 SilKit_Version_GitHash_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, ctypes.c_char_p)
 
 ###### Logger.h ######
@@ -263,16 +418,20 @@ class SilKit_Logger(ctypes.Structure):
     _pack_ = 8
 SilKit_Logger_p = ctypes.POINTER(SilKit_Logger)
 
-SilKit_Logger_Log = _silkit_.SilKit_Logger_Log
-SilKit_Logger_Log.restype = SilKit_ReturnCode
-SilKit_Logger_Log.argtypes = [SilKit_Logger_p, SilKit_LoggingLevel, ctypes.c_char_p]
-SilKit_Logger_Log.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Logger_Log",
+    SilKit_ReturnCode,
+    [SilKit_Logger_p, SilKit_LoggingLevel, ctypes.c_char_p],
+    check_silkit_status
+)
 SilKit_Logger_Log_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, SilKit_Logger_p, SilKit_LoggingLevel, ctypes.c_char_p)
 
-SilKit_Logger_GetLogLevel = _silkit_.SilKit_Logger_GetLogLevel
-SilKit_Logger_GetLogLevel.restype = SilKit_ReturnCode
-SilKit_Logger_GetLogLevel.argtypes = [SilKit_Logger_p, ctypes.POINTER(SilKit_LoggingLevel)]
-SilKit_Logger_GetLogLevel.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Logger_GetLogLevel",
+    SilKit_ReturnCode,
+    [SilKit_Logger_p, ctypes.POINTER(SilKit_LoggingLevel)],
+    check_silkit_status
+)
 SilKit_Logger_GetLogLevel_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, SilKit_Logger_p, ctypes.POINTER(SilKit_LoggingLevel))
 
 ###### Participant.h ######
@@ -280,15 +439,17 @@ SilKit_Logger_GetLogLevel_t = ctypes.CFUNCTYPE(SilKit_ReturnCode, SilKit_Logger_
 SilKit_NanosecondsTime = ctypes.c_uint64
 SilKit_NanosecondsWallclockTime = ctypes.c_uint64
 
-SilKit_Participant_Create = _silkit_.SilKit_Participant_Create
-SilKit_Participant_Create.restype = SilKit_ReturnCode
-SilKit_Participant_Create.argtypes = [
-    ctypes.POINTER(SilKit_Participant_p), 
-    SilKit_ParticipantConfiguration_p, 
-    ctypes.c_char_p, 
-    ctypes.c_char_p
-]
-SilKit_Participant_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Participant_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Participant_p),
+        SilKit_ParticipantConfiguration_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_Participant_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode, 
     ctypes.POINTER(SilKit_Participant_p),
@@ -297,22 +458,21 @@ SilKit_Participant_Create_t = ctypes.CFUNCTYPE(
     ctypes.c_char_p
 )
 
-SilKit_Participant_Destroy = _silkit_.SilKit_Participant_Destroy
-SilKit_Participant_Destroy.restype = SilKit_ReturnCode
-SilKit_Participant_Destroy.argtypes = [SilKit_Participant_p]
-SilKit_Participant_Destroy.errcheck = check_silkit_status
+_declare_("SilKit_Participant_Destroy", SilKit_ReturnCode, [SilKit_Participant_p], check_silkit_status)
 SilKit_Participant_Destroy_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode, 
     SilKit_Participant_p
 )
 
-SilKit_Participant_GetLogger = _silkit_.SilKit_Participant_GetLogger
-SilKit_Participant_GetLogger.restype = SilKit_ReturnCode
-SilKit_Participant_GetLogger.argtypes = [
-    ctypes.POINTER(SilKit_Logger_p), 
-    SilKit_Participant_p
-]
-SilKit_Participant_GetLogger.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Participant_GetLogger",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Logger_p),
+        SilKit_Participant_p
+    ],
+    check_silkit_status
+)
 SilKit_Participant_GetLogger_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode, 
     ctypes.POINTER(SilKit_Logger_p), 
@@ -577,25 +737,29 @@ class SilKit_STRUCT_VERSION(enum.IntEnum):
 
 ###### Vendor.h ######
 
-SilKit_Vendor_Vector_SilKitRegistry_Create = _silkit_.SilKit_Vendor_Vector_SilKitRegistry_Create
-SilKit_Vendor_Vector_SilKitRegistry_Create.restype = SilKit_ReturnCode
-SilKit_Vendor_Vector_SilKitRegistry_Create.argtypes = [
-    ctypes.POINTER(SilKit_Vendor_Vector_SilKitRegistry_p),
-    SilKit_ParticipantConfiguration_p
-]
-SilKit_Vendor_Vector_SilKitRegistry_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Vendor_Vector_SilKitRegistry_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Vendor_Vector_SilKitRegistry_p),
+        SilKit_ParticipantConfiguration_p
+    ],
+    check_silkit_status
+)
 SilKit_Vendor_Vector_SilKitRegistry_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Vendor_Vector_SilKitRegistry_p),
     SilKit_ParticipantConfiguration_p
 )
 
-SilKit_Vendor_Vector_SilKitRegistry_Destroy = _silkit_.SilKit_Vendor_Vector_SilKitRegistry_Destroy
-SilKit_Vendor_Vector_SilKitRegistry_Destroy.restype = SilKit_ReturnCode
-SilKit_Vendor_Vector_SilKitRegistry_Destroy.argtypes = [
-    SilKit_Vendor_Vector_SilKitRegistry_p,
-]
-SilKit_Vendor_Vector_SilKitRegistry_Destroy.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Vendor_Vector_SilKitRegistry_Destroy",
+    SilKit_ReturnCode,
+    [
+        SilKit_Vendor_Vector_SilKitRegistry_p,
+    ],
+    check_silkit_status
+)
 SilKit_Vendor_Vector_SilKitRegistry_Destroy_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Vendor_Vector_SilKitRegistry_p
@@ -607,14 +771,16 @@ SilKit_Vendor_Vector_SilKitRegistry_AllDisconnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_Vendor_Vector_SilKitRegistry_p
 )
 
-SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler = _silkit_.SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler
-SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler.restype = SilKit_ReturnCode
-SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler.argtypes = [
-    SilKit_Vendor_Vector_SilKitRegistry_p,
-    ctypes.c_void_p,
-    SilKit_Vendor_Vector_SilKitRegistry_AllDisconnectedHandler_t,
-]
-SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_Vendor_Vector_SilKitRegistry_p,
+        ctypes.c_void_p,
+        SilKit_Vendor_Vector_SilKitRegistry_AllDisconnectedHandler_t,
+    ],
+    check_silkit_status
+)
 SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Vendor_Vector_SilKitRegistry_p,
@@ -622,27 +788,31 @@ SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler_t = ctypes.CFUNCTY
     SilKit_Vendor_Vector_SilKitRegistry_AllDisconnectedHandler_t
 )
 
-SilKit_Vendor_Vector_SilKitRegistry_GetLogger = _silkit_.SilKit_Vendor_Vector_SilKitRegistry_GetLogger
-SilKit_Vendor_Vector_SilKitRegistry_GetLogger.restype = SilKit_ReturnCode
-SilKit_Vendor_Vector_SilKitRegistry_GetLogger.argtypes = [
-    ctypes.POINTER(SilKit_Logger_p),
-    SilKit_Vendor_Vector_SilKitRegistry_p,
-]
-SilKit_Vendor_Vector_SilKitRegistry_GetLogger.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Vendor_Vector_SilKitRegistry_GetLogger",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Logger_p),
+        SilKit_Vendor_Vector_SilKitRegistry_p,
+    ],
+    check_silkit_status
+)
 SilKit_Vendor_Vector_SilKitRegistry_GetLogger_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Logger_p),
     SilKit_Vendor_Vector_SilKitRegistry_p
 )
 
-SilKit_Vendor_Vector_SilKitRegistry_StartListening = _silkit_.SilKit_Vendor_Vector_SilKitRegistry_StartListening
-SilKit_Vendor_Vector_SilKitRegistry_StartListening.restype = SilKit_ReturnCode
-SilKit_Vendor_Vector_SilKitRegistry_StartListening.argtypes = [
-    SilKit_Vendor_Vector_SilKitRegistry_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(ctypes.c_char_p),
-]
-SilKit_Vendor_Vector_SilKitRegistry_StartListening.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Vendor_Vector_SilKitRegistry_StartListening",
+    SilKit_ReturnCode,
+    [
+        SilKit_Vendor_Vector_SilKitRegistry_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_char_p),
+    ],
+    check_silkit_status
+)
 SilKit_Vendor_Vector_SilKitRegistry_StartListening_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Vendor_Vector_SilKitRegistry_p,
@@ -652,56 +822,62 @@ SilKit_Vendor_Vector_SilKitRegistry_StartListening_t = ctypes.CFUNCTYPE(
 
 ###### SilKit.h ######
 
-SilKit_ReturnCodeToString = _silkit_.SilKit_ReturnCodeToString
-SilKit_ReturnCodeToString.restype = SilKit_ReturnCode
-SilKit_ReturnCodeToString.argtypes = [
-    ctypes.POINTER(ctypes.c_char_p),
-    SilKit_ReturnCode
-]
-SilKit_ReturnCodeToString.errcheck = check_silkit_status
+_declare_(
+    "SilKit_ReturnCodeToString",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(ctypes.c_char_p),
+        SilKit_ReturnCode
+    ],
+    check_silkit_status
+)
 SilKit_ReturnCodeToString_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(ctypes.c_char_p),
     SilKit_ReturnCode
 )
 
-SilKit_GetLastErrorString = _silkit_.SilKit_GetLastErrorString
-SilKit_GetLastErrorString.restype = ctypes.c_char_p
-SilKit_GetLastErrorString.argtypes = []
+_declare_("SilKit_GetLastErrorString", ctypes.c_char_p, [], None)
 SilKit_GetLastErrorString_t = ctypes.CFUNCTYPE(ctypes.c_char_p)
 
-SilKit_ParticipantConfiguration_FromString = _silkit_.SilKit_ParticipantConfiguration_FromString
-SilKit_ParticipantConfiguration_FromString.restype = SilKit_ReturnCode
-SilKit_ParticipantConfiguration_FromString.argtypes = [
-    ctypes.POINTER(SilKit_ParticipantConfiguration_p),
-    ctypes.c_char_p
-]
-SilKit_ParticipantConfiguration_FromString.errcheck = check_silkit_status
+_declare_(
+    "SilKit_ParticipantConfiguration_FromString",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_ParticipantConfiguration_p),
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_ParticipantConfiguration_FromString_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_ParticipantConfiguration_p),
     ctypes.c_char_p
 )
 
-SilKit_ParticipantConfiguration_FromFile = _silkit_.SilKit_ParticipantConfiguration_FromFile
-SilKit_ParticipantConfiguration_FromFile.restype = SilKit_ReturnCode
-SilKit_ParticipantConfiguration_FromFile.argtypes = [
-    ctypes.POINTER(SilKit_ParticipantConfiguration_p),
-    ctypes.c_char_p
-]
-SilKit_ParticipantConfiguration_FromFile.errcheck = check_silkit_status
+_declare_(
+    "SilKit_ParticipantConfiguration_FromFile",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_ParticipantConfiguration_p),
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_ParticipantConfiguration_FromFile_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_ParticipantConfiguration_p),
     ctypes.c_char_p
 )
 
-SilKit_ParticipantConfiguration_Destroy = _silkit_.SilKit_ParticipantConfiguration_Destroy
-SilKit_ParticipantConfiguration_Destroy.restype = SilKit_ReturnCode
-SilKit_ParticipantConfiguration_Destroy.argtypes = [
-    SilKit_ParticipantConfiguration_p
-]
-SilKit_ParticipantConfiguration_Destroy.errcheck = check_silkit_status
+_declare_(
+    "SilKit_ParticipantConfiguration_Destroy",
+    SilKit_ReturnCode,
+    [
+        SilKit_ParticipantConfiguration_p
+    ],
+    check_silkit_status
+)
 SilKit_ParticipantConfiguration_Destroy_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_ParticipantConfiguration_p
@@ -787,14 +963,16 @@ class SilKit_TimeSyncService(ctypes.Structure):
     _pack_ = 8
 SilKit_TimeSyncService_p = ctypes.POINTER(SilKit_TimeSyncService)
 
-SilKit_LifecycleService_Create = _silkit_.SilKit_LifecycleService_Create
-SilKit_LifecycleService_Create.restype = SilKit_ReturnCode
-SilKit_LifecycleService_Create.argtypes = [
-    ctypes.POINTER(SilKit_LifecycleService_p),
-    SilKit_Participant_p,
-    SilKit_LifecycleConfiguration_p,
-]
-SilKit_LifecycleService_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_LifecycleService_p),
+        SilKit_Participant_p,
+        SilKit_LifecycleConfiguration_p,
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_LifecycleService_p),
@@ -808,14 +986,16 @@ SilKit_LifecycleService_CommunicationReadyHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_SetCommunicationReadyHandler = _silkit_.SilKit_LifecycleService_SetCommunicationReadyHandler
-SilKit_LifecycleService_SetCommunicationReadyHandler.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetCommunicationReadyHandler.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_CommunicationReadyHandler_t
-]
-SilKit_LifecycleService_SetCommunicationReadyHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetCommunicationReadyHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_CommunicationReadyHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetCommunicationReadyHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -823,14 +1003,16 @@ SilKit_LifecycleService_SetCommunicationReadyHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_CommunicationReadyHandler_t
 )
 
-SilKit_LifecycleService_SetCommunicationReadyHandlerAsync = _silkit_.SilKit_LifecycleService_SetCommunicationReadyHandlerAsync
-SilKit_LifecycleService_SetCommunicationReadyHandlerAsync.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetCommunicationReadyHandlerAsync.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_CommunicationReadyHandler_t
-]
-SilKit_LifecycleService_SetCommunicationReadyHandlerAsync.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetCommunicationReadyHandlerAsync",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_CommunicationReadyHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetCommunicationReadyHandlerAsync_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -838,12 +1020,14 @@ SilKit_LifecycleService_SetCommunicationReadyHandlerAsync_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_CommunicationReadyHandler_t
 )
 
-SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync = _silkit_.SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync
-SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync.restype = SilKit_ReturnCode
-SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync.argtypes = [
-    SilKit_LifecycleService_p
-]
-SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_CompleteCommunicationReadyHandlerAsync_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p
@@ -855,14 +1039,16 @@ SilKit_LifecycleService_StartingHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_SetStartingHandler = _silkit_.SilKit_LifecycleService_SetStartingHandler
-SilKit_LifecycleService_SetStartingHandler.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetStartingHandler.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_StartingHandler_t
-]
-SilKit_LifecycleService_SetStartingHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetStartingHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_StartingHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetStartingHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -876,14 +1062,16 @@ SilKit_LifecycleService_StopHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_SetStopHandler = _silkit_.SilKit_LifecycleService_SetStopHandler
-SilKit_LifecycleService_SetStopHandler.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetStopHandler.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_StopHandler_t
-]
-SilKit_LifecycleService_SetStopHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetStopHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_StopHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetStopHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -897,14 +1085,16 @@ SilKit_LifecycleService_ShutdownHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_SetShutdownHandler = _silkit_.SilKit_LifecycleService_SetShutdownHandler
-SilKit_LifecycleService_SetShutdownHandler.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetShutdownHandler.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_ShutdownHandler_t
-]
-SilKit_LifecycleService_SetShutdownHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetShutdownHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_ShutdownHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetShutdownHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -919,14 +1109,16 @@ SilKit_LifecycleService_AbortHandler_t = ctypes.CFUNCTYPE(
     SilKit_ParticipantState
 )
 
-SilKit_LifecycleService_SetAbortHandler = _silkit_.SilKit_LifecycleService_SetAbortHandler
-SilKit_LifecycleService_SetAbortHandler.restype = SilKit_ReturnCode
-SilKit_LifecycleService_SetAbortHandler.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_void_p,
-    SilKit_LifecycleService_AbortHandler_t
-]
-SilKit_LifecycleService_SetAbortHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_SetAbortHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_void_p,
+        SilKit_LifecycleService_AbortHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_SetAbortHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
@@ -934,114 +1126,132 @@ SilKit_LifecycleService_SetAbortHandler_t = ctypes.CFUNCTYPE(
     SilKit_LifecycleService_AbortHandler_t
 )
 
-SilKit_LifecycleService_StartLifecycle = _silkit_.SilKit_LifecycleService_StartLifecycle
-SilKit_LifecycleService_StartLifecycle.restype = SilKit_ReturnCode
-SilKit_LifecycleService_StartLifecycle.argtypes = [
-    SilKit_LifecycleService_p,
-]
-SilKit_LifecycleService_StartLifecycle.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_StartLifecycle",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_StartLifecycle_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_WaitForLifecycleToComplete = _silkit_.SilKit_LifecycleService_WaitForLifecycleToComplete
-SilKit_LifecycleService_WaitForLifecycleToComplete.restype = SilKit_ReturnCode
-SilKit_LifecycleService_WaitForLifecycleToComplete.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.POINTER(SilKit_ParticipantState)
-]
-SilKit_LifecycleService_WaitForLifecycleToComplete.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_WaitForLifecycleToComplete",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.POINTER(SilKit_ParticipantState)
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_WaitForLifecycleToComplete_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
     ctypes.POINTER(SilKit_ParticipantState)
 )
 
-SilKit_LifecycleService_ReportError = _silkit_.SilKit_LifecycleService_ReportError
-SilKit_LifecycleService_ReportError.restype = SilKit_ReturnCode
-SilKit_LifecycleService_ReportError.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_char_p
-]
-SilKit_LifecycleService_ReportError.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_ReportError",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_ReportError_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
     ctypes.c_char_p
 )
 
-SilKit_LifecycleService_Pause = _silkit_.SilKit_LifecycleService_Pause
-SilKit_LifecycleService_Pause.restype = SilKit_ReturnCode
-SilKit_LifecycleService_Pause.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_char_p
-]
-SilKit_LifecycleService_Pause.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_Pause",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_Pause_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
     ctypes.c_char_p
 )
 
-SilKit_LifecycleService_Continue = _silkit_.SilKit_LifecycleService_Continue
-SilKit_LifecycleService_Continue.restype = SilKit_ReturnCode
-SilKit_LifecycleService_Continue.argtypes = [
-    SilKit_LifecycleService_p
-]
-SilKit_LifecycleService_Continue.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_Continue",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p
+    ],
+    check_silkit_status
+)
 
 SilKit_LifecycleService_Continue_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_Stop = _silkit_.SilKit_LifecycleService_Stop
-SilKit_LifecycleService_Stop.restype = SilKit_ReturnCode
-SilKit_LifecycleService_Stop.argtypes = [
-    SilKit_LifecycleService_p,
-    ctypes.c_char_p
-]
-SilKit_LifecycleService_Stop.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_Stop",
+    SilKit_ReturnCode,
+    [
+        SilKit_LifecycleService_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_Stop_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LifecycleService_p,
     ctypes.c_char_p
 )
 
-SilKit_LifecycleService_State = _silkit_.SilKit_LifecycleService_State
-SilKit_LifecycleService_State.restype = SilKit_ReturnCode
-SilKit_LifecycleService_State.argtypes = [
-    ctypes.POINTER(SilKit_ParticipantState),
-    SilKit_LifecycleService_p
-]
-SilKit_LifecycleService_State.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_State",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_ParticipantState),
+        SilKit_LifecycleService_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_State_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_ParticipantState),
     SilKit_LifecycleService_p
 )
 
-SilKit_LifecycleService_Status = _silkit_.SilKit_LifecycleService_Status
-SilKit_LifecycleService_Status.restype = SilKit_ReturnCode
-SilKit_LifecycleService_Status.argtypes = [
-    SilKit_ParticipantStatus_p,
-    SilKit_LifecycleService_p
-]
-SilKit_LifecycleService_Status.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LifecycleService_Status",
+    SilKit_ReturnCode,
+    [
+        SilKit_ParticipantStatus_p,
+        SilKit_LifecycleService_p
+    ],
+    check_silkit_status
+)
 SilKit_LifecycleService_Status_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_ParticipantStatus_p,
     SilKit_LifecycleService_p
 )
 
-SilKit_TimeSyncService_Create = _silkit_.SilKit_TimeSyncService_Create
-SilKit_TimeSyncService_Create.restype = SilKit_ReturnCode
-SilKit_TimeSyncService_Create.argtypes = [
-    ctypes.POINTER(SilKit_TimeSyncService_p),
-    SilKit_LifecycleService_p
-]
-SilKit_TimeSyncService_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_TimeSyncService_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_TimeSyncService_p),
+        SilKit_LifecycleService_p
+    ],
+    check_silkit_status
+)
 SilKit_TimeSyncService_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_TimeSyncService_p),
@@ -1056,15 +1266,17 @@ SilKit_TimeSyncService_SimulationStepHandler_t = ctypes.CFUNCTYPE(
     SilKit_NanosecondsTime
 )
 
-SilKit_TimeSyncService_SetSimulationStepHandler = _silkit_.SilKit_TimeSyncService_SetSimulationStepHandler
-SilKit_TimeSyncService_SetSimulationStepHandler.restype = SilKit_ReturnCode
-SilKit_TimeSyncService_SetSimulationStepHandler.argtypes = [
-    SilKit_TimeSyncService_p,
-    ctypes.c_void_p,
-    SilKit_TimeSyncService_SimulationStepHandler_t,
-    SilKit_NanosecondsTime
-]
-SilKit_TimeSyncService_SetSimulationStepHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_TimeSyncService_SetSimulationStepHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_TimeSyncService_p,
+        ctypes.c_void_p,
+        SilKit_TimeSyncService_SimulationStepHandler_t,
+        SilKit_NanosecondsTime
+    ],
+    check_silkit_status
+)
 SilKit_TimeSyncService_SetSimulationStepHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_TimeSyncService_p,
@@ -1073,15 +1285,17 @@ SilKit_TimeSyncService_SetSimulationStepHandler_t = ctypes.CFUNCTYPE(
     SilKit_NanosecondsTime
 )
 
-SilKit_TimeSyncService_SetSimulationStepHandlerAsync = _silkit_.SilKit_TimeSyncService_SetSimulationStepHandlerAsync
-SilKit_TimeSyncService_SetSimulationStepHandlerAsync.restype = SilKit_ReturnCode
-SilKit_TimeSyncService_SetSimulationStepHandlerAsync.argtypes = [
-    SilKit_TimeSyncService_p,
-    ctypes.c_void_p,
-    SilKit_TimeSyncService_SimulationStepHandler_t,
-    SilKit_NanosecondsTime
-]
-SilKit_TimeSyncService_SetSimulationStepHandlerAsync.errcheck = check_silkit_status
+_declare_(
+    "SilKit_TimeSyncService_SetSimulationStepHandlerAsync",
+    SilKit_ReturnCode,
+    [
+        SilKit_TimeSyncService_p,
+        ctypes.c_void_p,
+        SilKit_TimeSyncService_SimulationStepHandler_t,
+        SilKit_NanosecondsTime
+    ],
+    check_silkit_status
+)
 SilKit_TimeSyncService_SetSimulationStepHandlerAsync_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_TimeSyncService_p,
@@ -1090,51 +1304,59 @@ SilKit_TimeSyncService_SetSimulationStepHandlerAsync_t = ctypes.CFUNCTYPE(
     SilKit_NanosecondsTime
 )
 
-SilKit_TimeSyncService_CompleteSimulationStep = _silkit_.SilKit_TimeSyncService_CompleteSimulationStep
-SilKit_TimeSyncService_CompleteSimulationStep.restype = SilKit_ReturnCode
-SilKit_TimeSyncService_CompleteSimulationStep.argtypes = [
-    SilKit_TimeSyncService_p
-]
-SilKit_TimeSyncService_CompleteSimulationStep.errcheck = check_silkit_status
+_declare_(
+    "SilKit_TimeSyncService_CompleteSimulationStep",
+    SilKit_ReturnCode,
+    [
+        SilKit_TimeSyncService_p
+    ],
+    check_silkit_status
+)
 SilKit_TimeSyncService_CompleteSimulationStep_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_TimeSyncService_p
 )
 
-SilKit_TimeSyncService_Now = _silkit_.SilKit_TimeSyncService_Now
-SilKit_TimeSyncService_Now.restype = SilKit_ReturnCode
-SilKit_TimeSyncService_Now.argtypes = [
-    SilKit_TimeSyncService_p,
-    ctypes.POINTER(SilKit_NanosecondsTime)
-]
-SilKit_TimeSyncService_Now.errcheck = check_silkit_status
+_declare_(
+    "SilKit_TimeSyncService_Now",
+    SilKit_ReturnCode,
+    [
+        SilKit_TimeSyncService_p,
+        ctypes.POINTER(SilKit_NanosecondsTime)
+    ],
+    check_silkit_status
+)
 SilKit_TimeSyncService_Now_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_TimeSyncService_p,
     ctypes.POINTER(SilKit_NanosecondsTime)
 )
 
-SilKit_SystemMonitor_Create = _silkit_.SilKit_SystemMonitor_Create
-SilKit_SystemMonitor_Create.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_Create.argtypes = [
-    ctypes.POINTER(SilKit_SystemMonitor_p),
-    SilKit_Participant_p
-]
-SilKit_SystemMonitor_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_SystemMonitor_p),
+        SilKit_Participant_p
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_SystemMonitor_p),
     SilKit_Participant_p
 )
 
-SilKit_SystemMonitor_GetParticipantStatus = _silkit_.SilKit_SystemMonitor_GetParticipantStatus
-SilKit_SystemMonitor_GetParticipantStatus.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_GetParticipantStatus.argtypes = [
-    SilKit_ParticipantStatus_p,
-    SilKit_SystemMonitor_p,
-    ctypes.c_char_p
-]
-SilKit_SystemMonitor_GetParticipantStatus.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_GetParticipantStatus",
+    SilKit_ReturnCode,
+    [
+        SilKit_ParticipantStatus_p,
+        SilKit_SystemMonitor_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_GetParticipantStatus_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_ParticipantStatus_p,
@@ -1142,13 +1364,15 @@ SilKit_SystemMonitor_GetParticipantStatus_t = ctypes.CFUNCTYPE(
     ctypes.c_char_p
 )
 
-SilKit_SystemMonitor_GetSystemState = _silkit_.SilKit_SystemMonitor_GetSystemState
-SilKit_SystemMonitor_GetSystemState.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_GetSystemState.argtypes = [
-    ctypes.POINTER(SilKit_SystemState),
-    SilKit_SystemMonitor_p
-]
-SilKit_SystemMonitor_GetSystemState.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_GetSystemState",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_SystemState),
+        SilKit_SystemMonitor_p
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_GetSystemState_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_SystemState),
@@ -1162,15 +1386,17 @@ SilKit_SystemStateHandler_t = ctypes.CFUNCTYPE(
     SilKit_SystemState
 )
 
-SilKit_SystemMonitor_AddSystemStateHandler = _silkit_.SilKit_SystemMonitor_AddSystemStateHandler
-SilKit_SystemMonitor_AddSystemStateHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_AddSystemStateHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    ctypes.c_void_p,
-    SilKit_SystemStateHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_SystemMonitor_AddSystemStateHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_AddSystemStateHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        ctypes.c_void_p,
+        SilKit_SystemStateHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_AddSystemStateHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1179,13 +1405,15 @@ SilKit_SystemMonitor_AddSystemStateHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_SystemMonitor_RemoveSystemStateHandler = _silkit_.SilKit_SystemMonitor_RemoveSystemStateHandler
-SilKit_SystemMonitor_RemoveSystemStateHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_RemoveSystemStateHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    SilKit_HandlerId
-]
-SilKit_SystemMonitor_RemoveSystemStateHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_RemoveSystemStateHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_RemoveSystemStateHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1200,15 +1428,17 @@ SilKit_ParticipantStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ParticipantStatus_p
 )
 
-SilKit_SystemMonitor_AddParticipantStatusHandler = _silkit_.SilKit_SystemMonitor_AddParticipantStatusHandler
-SilKit_SystemMonitor_AddParticipantStatusHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_AddParticipantStatusHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    ctypes.c_void_p,
-    SilKit_ParticipantStatusHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_SystemMonitor_AddParticipantStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_AddParticipantStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        ctypes.c_void_p,
+        SilKit_ParticipantStatusHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_AddParticipantStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1217,13 +1447,15 @@ SilKit_SystemMonitor_AddParticipantStatusHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_SystemMonitor_RemoveParticipantStatusHandler = _silkit_.SilKit_SystemMonitor_RemoveParticipantStatusHandler
-SilKit_SystemMonitor_RemoveParticipantStatusHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_RemoveParticipantStatusHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    SilKit_HandlerId
-]
-SilKit_SystemMonitor_RemoveParticipantStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_RemoveParticipantStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_RemoveParticipantStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1245,14 +1477,16 @@ SilKit_SystemMonitor_ParticipantConnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_ParticipantConnectionInformation_p
 )
 
-SilKit_SystemMonitor_SetParticipantConnectedHandler = _silkit_.SilKit_SystemMonitor_SetParticipantConnectedHandler
-SilKit_SystemMonitor_SetParticipantConnectedHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_SetParticipantConnectedHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    ctypes.c_void_p,
-    SilKit_SystemMonitor_ParticipantConnectedHandler_t
-]
-SilKit_SystemMonitor_SetParticipantConnectedHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_SetParticipantConnectedHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        ctypes.c_void_p,
+        SilKit_SystemMonitor_ParticipantConnectedHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_SetParticipantConnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1267,14 +1501,16 @@ SilKit_SystemMonitor_ParticipantDisconnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_ParticipantConnectionInformation_p
 )
 
-SilKit_SystemMonitor_SetParticipantDisconnectedHandler = _silkit_.SilKit_SystemMonitor_SetParticipantDisconnectedHandler
-SilKit_SystemMonitor_SetParticipantDisconnectedHandler.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_SetParticipantDisconnectedHandler.argtypes = [
-    SilKit_SystemMonitor_p,
-    ctypes.c_void_p,
-    SilKit_SystemMonitor_ParticipantDisconnectedHandler_t
-]
-SilKit_SystemMonitor_SetParticipantDisconnectedHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_SetParticipantDisconnectedHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        ctypes.c_void_p,
+        SilKit_SystemMonitor_ParticipantDisconnectedHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_SetParticipantDisconnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1282,14 +1518,16 @@ SilKit_SystemMonitor_SetParticipantDisconnectedHandler_t = ctypes.CFUNCTYPE(
     SilKit_SystemMonitor_ParticipantDisconnectedHandler_t
 )
 
-SilKit_SystemMonitor_IsParticipantConnected = _silkit_.SilKit_SystemMonitor_IsParticipantConnected
-SilKit_SystemMonitor_IsParticipantConnected.restype = SilKit_ReturnCode
-SilKit_SystemMonitor_IsParticipantConnected.argtypes = [
-    SilKit_SystemMonitor_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(SilKit_Bool)
-]
-SilKit_SystemMonitor_IsParticipantConnected.errcheck = check_silkit_status
+_declare_(
+    "SilKit_SystemMonitor_IsParticipantConnected",
+    SilKit_ReturnCode,
+    [
+        SilKit_SystemMonitor_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(SilKit_Bool)
+    ],
+    check_silkit_status
+)
 SilKit_SystemMonitor_IsParticipantConnected_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_SystemMonitor_p,
@@ -1297,37 +1535,43 @@ SilKit_SystemMonitor_IsParticipantConnected_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Bool)
 )
 
-SilKit_Experimental_SystemController_Create = _silkit_.SilKit_Experimental_SystemController_Create
-SilKit_Experimental_SystemController_Create.restype = SilKit_ReturnCode
-SilKit_Experimental_SystemController_Create.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_SystemController_p),
-    SilKit_Participant_p
-]
-SilKit_Experimental_SystemController_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_SystemController_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_SystemController_p),
+        SilKit_Participant_p
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_SystemController_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_SystemController_p),
     SilKit_Participant_p
 )
 
-SilKit_Experimental_SystemController_AbortSimulation = _silkit_.SilKit_Experimental_SystemController_AbortSimulation
-SilKit_Experimental_SystemController_AbortSimulation.restype = SilKit_ReturnCode
-SilKit_Experimental_SystemController_AbortSimulation.argtypes = [
-    SilKit_Experimental_SystemController_p
-]
-SilKit_Experimental_SystemController_AbortSimulation.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_SystemController_AbortSimulation",
+    SilKit_ReturnCode,
+    [
+        SilKit_Experimental_SystemController_p
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_SystemController_AbortSimulation_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Experimental_SystemController_p
 )
 
-SilKit_Experimental_SystemController_SetWorkflowConfiguration = _silkit_.SilKit_Experimental_SystemController_SetWorkflowConfiguration
-SilKit_Experimental_SystemController_SetWorkflowConfiguration.restype = SilKit_ReturnCode
-SilKit_Experimental_SystemController_SetWorkflowConfiguration.argtypes = [
-    SilKit_Experimental_SystemController_p,
-    SilKit_WorkflowConfiguration_p
-]
-SilKit_Experimental_SystemController_SetWorkflowConfiguration.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_SystemController_SetWorkflowConfiguration",
+    SilKit_ReturnCode,
+    [
+        SilKit_Experimental_SystemController_p,
+        SilKit_WorkflowConfiguration_p
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_SystemController_SetWorkflowConfiguration_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Experimental_SystemController_p,
@@ -1470,15 +1714,17 @@ SilKit_CanErrorStateChangeHandler_t = ctypes.CFUNCTYPE(
 
 # The lifetime of the resulting CAN controller is directly bound to the lifetime of the simulation participant.
 # The object returned must not be deallocated using free()
-SilKit_CanController_Create = _silkit_.SilKit_CanController_Create
-SilKit_CanController_Create.restype = SilKit_ReturnCode
-SilKit_CanController_Create.argtypes = [
-    ctypes.POINTER(SilKit_CanController_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.c_char_p
-]
-SilKit_CanController_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_CanController_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_CanController_p),
@@ -1487,58 +1733,68 @@ SilKit_CanController_Create_t = ctypes.CFUNCTYPE(
     ctypes.c_char_p
 )
 
-SilKit_CanController_Start = _silkit_.SilKit_CanController_Start
-SilKit_CanController_Start.restype = SilKit_ReturnCode
-SilKit_CanController_Start.argtypes = [
-    SilKit_CanController_p
-]
-SilKit_CanController_Start.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_Start",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_Start_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p
 )
 
-SilKit_CanController_Stop = _silkit_.SilKit_CanController_Stop
-SilKit_CanController_Stop.restype = SilKit_ReturnCode
-SilKit_CanController_Stop.argtypes = [
-    SilKit_CanController_p
-]
-SilKit_CanController_Stop.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_Stop",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_Stop_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p
 )
 
-SilKit_CanController_Reset = _silkit_.SilKit_CanController_Reset
-SilKit_CanController_Reset.restype = SilKit_ReturnCode
-SilKit_CanController_Reset.argtypes = [
-    SilKit_CanController_p
-]
-SilKit_CanController_Reset.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_Reset",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_Reset_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p
 )
 
-SilKit_CanController_Sleep = _silkit_.SilKit_CanController_Sleep
-SilKit_CanController_Sleep.restype = SilKit_ReturnCode
-SilKit_CanController_Sleep.argtypes = [
-    SilKit_CanController_p
-]
-SilKit_CanController_Sleep.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_Sleep",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_Sleep_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p
 )
 
-SilKit_CanController_SendFrame = _silkit_.SilKit_CanController_SendFrame
-SilKit_CanController_SendFrame.restype = SilKit_ReturnCode
-SilKit_CanController_SendFrame.argtypes = [
-    SilKit_CanController_p,
-    SilKit_CanFrame_p,
-    ctypes.c_void_p
-]
-SilKit_CanController_SendFrame.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_SendFrame",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        SilKit_CanFrame_p,
+        ctypes.c_void_p
+    ],
+    check_silkit_status
+)
 SilKit_CanController_SendFrame_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1546,15 +1802,17 @@ SilKit_CanController_SendFrame_t = ctypes.CFUNCTYPE(
     ctypes.c_void_p
 )
 
-SilKit_CanController_SetBaudRate = _silkit_.SilKit_CanController_SetBaudRate
-SilKit_CanController_SetBaudRate.restype = SilKit_ReturnCode
-SilKit_CanController_SetBaudRate.argtypes = [
-    SilKit_CanController_p,
-    ctypes.c_uint32,
-    ctypes.c_uint32,
-    ctypes.c_uint32
-]
-SilKit_CanController_SetBaudRate.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_SetBaudRate",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+        ctypes.c_uint32
+    ],
+    check_silkit_status
+)
 SilKit_CanController_SetBaudRate_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1564,16 +1822,18 @@ SilKit_CanController_SetBaudRate_t = ctypes.CFUNCTYPE(
 )
 
 # Full support in a detailed simulation. In simple simulation, all messages are automatically positively acknowledged.
-SilKit_CanController_AddFrameTransmitHandler = _silkit_.SilKit_CanController_AddFrameTransmitHandler
-SilKit_CanController_AddFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_CanController_AddFrameTransmitHandler.argtypes = [
-    SilKit_CanController_p,
-    ctypes.c_void_p,
-    SilKit_CanFrameTransmitHandler_t,
-    SilKit_CanTransmitStatus,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_CanController_AddFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_AddFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        ctypes.c_void_p,
+        SilKit_CanFrameTransmitHandler_t,
+        SilKit_CanTransmitStatus,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_CanController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1583,29 +1843,33 @@ SilKit_CanController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_CanController_RemoveFrameTransmitHandler = _silkit_.SilKit_CanController_RemoveFrameTransmitHandler
-SilKit_CanController_RemoveFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_CanController_RemoveFrameTransmitHandler.argtypes = [
-    SilKit_CanController_p,
-    SilKit_HandlerId
-]
-SilKit_CanController_RemoveFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_RemoveFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_CanController_RemoveFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
     SilKit_HandlerId
 )
 
-SilKit_CanController_AddFrameHandler = _silkit_.SilKit_CanController_AddFrameHandler
-SilKit_CanController_AddFrameHandler.restype = SilKit_ReturnCode
-SilKit_CanController_AddFrameHandler.argtypes = [
-    SilKit_CanController_p,
-    ctypes.c_void_p,
-    SilKit_CanFrameHandler_t,
-    SilKit_Direction,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_CanController_AddFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_AddFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        ctypes.c_void_p,
+        SilKit_CanFrameHandler_t,
+        SilKit_Direction,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_CanController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1615,28 +1879,32 @@ SilKit_CanController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_CanController_RemoveFrameHandler = _silkit_.SilKit_CanController_RemoveFrameHandler
-SilKit_CanController_RemoveFrameHandler.restype = SilKit_ReturnCode
-SilKit_CanController_RemoveFrameHandler.argtypes = [
-    SilKit_CanController_p,
-    SilKit_HandlerId
-]
-SilKit_CanController_RemoveFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_RemoveFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_CanController_RemoveFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
     SilKit_HandlerId
 )
 
-SilKit_CanController_AddStateChangeHandler = _silkit_.SilKit_CanController_AddStateChangeHandler
-SilKit_CanController_AddStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_CanController_AddStateChangeHandler.argtypes = [
-    SilKit_CanController_p,
-    ctypes.c_void_p,
-    SilKit_CanStateChangeHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_CanController_AddStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_AddStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        ctypes.c_void_p,
+        SilKit_CanStateChangeHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_CanController_AddStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1645,28 +1913,32 @@ SilKit_CanController_AddStateChangeHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_CanController_RemoveStateChangeHandler = _silkit_.SilKit_CanController_RemoveStateChangeHandler
-SilKit_CanController_RemoveStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_CanController_RemoveStateChangeHandler.argtypes = [
-    SilKit_CanController_p,
-    SilKit_HandlerId
-]
-SilKit_CanController_RemoveStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_RemoveStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_CanController_RemoveStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
     SilKit_HandlerId
 )
 
-SilKit_CanController_AddErrorStateChangeHandler = _silkit_.SilKit_CanController_AddErrorStateChangeHandler
-SilKit_CanController_AddErrorStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_CanController_AddErrorStateChangeHandler.argtypes = [
-    SilKit_CanController_p,
-    ctypes.c_void_p,
-    SilKit_CanErrorStateChangeHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_CanController_AddErrorStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_AddErrorStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        ctypes.c_void_p,
+        SilKit_CanErrorStateChangeHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_CanController_AddErrorStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1675,13 +1947,15 @@ SilKit_CanController_AddErrorStateChangeHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_CanController_RemoveErrorStateChangeHandler = _silkit_.SilKit_CanController_RemoveErrorStateChangeHandler
-SilKit_CanController_RemoveErrorStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_CanController_RemoveErrorStateChangeHandler.argtypes = [
-    SilKit_CanController_p,
-    SilKit_HandlerId
-]
-SilKit_CanController_RemoveErrorStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_CanController_RemoveErrorStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_CanController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_CanController_RemoveErrorStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_CanController_p,
@@ -1789,15 +2063,17 @@ SilKit_EthernetBitrateChangeHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_EthernetBitrateChangeEvent)
 )
 
-SilKit_EthernetController_Create = _silkit_.SilKit_EthernetController_Create
-SilKit_EthernetController_Create.restype = SilKit_ReturnCode
-SilKit_EthernetController_Create.argtypes = [
-    ctypes.POINTER(SilKit_EthernetController_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.c_char_p
-]
-SilKit_EthernetController_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_EthernetController_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_EthernetController_p),
@@ -1806,38 +2082,44 @@ SilKit_EthernetController_Create_t = ctypes.CFUNCTYPE(
     ctypes.c_char_p
 )
 
-SilKit_EthernetController_Activate = _silkit_.SilKit_EthernetController_Activate
-SilKit_EthernetController_Activate.restype = SilKit_ReturnCode
-SilKit_EthernetController_Activate.argtypes = [
-    SilKit_EthernetController_p
-]
-SilKit_EthernetController_Activate.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_Activate",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_Activate_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p
 )
 
-SilKit_EthernetController_Deactivate = _silkit_.SilKit_EthernetController_Deactivate
-SilKit_EthernetController_Deactivate.restype = SilKit_ReturnCode
-SilKit_EthernetController_Deactivate.argtypes = [
-    SilKit_EthernetController_p
-]
-SilKit_EthernetController_Deactivate.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_Deactivate",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_Deactivate_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p
 )
 
-SilKit_EthernetController_AddFrameHandler = _silkit_.SilKit_EthernetController_AddFrameHandler
-SilKit_EthernetController_AddFrameHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_AddFrameHandler.argtypes = [
-    SilKit_EthernetController_p,
-    ctypes.c_void_p,
-    SilKit_EthernetFrameHandler_t,
-    SilKit_Direction,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_EthernetController_AddFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_AddFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        ctypes.c_void_p,
+        SilKit_EthernetFrameHandler_t,
+        SilKit_Direction,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
@@ -1847,29 +2129,33 @@ SilKit_EthernetController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_EthernetController_RemoveFrameHandler = _silkit_.SilKit_EthernetController_RemoveFrameHandler
-SilKit_EthernetController_RemoveFrameHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_RemoveFrameHandler.argtypes = [
-    SilKit_EthernetController_p,
-    SilKit_HandlerId
-]
-SilKit_EthernetController_RemoveFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_RemoveFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_RemoveFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
     SilKit_HandlerId
 )
 
-SilKit_EthernetController_AddFrameTransmitHandler = _silkit_.SilKit_EthernetController_AddFrameTransmitHandler
-SilKit_EthernetController_AddFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_AddFrameTransmitHandler.argtypes = [
-    SilKit_EthernetController_p,
-    ctypes.c_void_p,
-    SilKit_EthernetFrameTransmitHandler_t,
-    SilKit_EthernetTransmitStatus,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_EthernetController_AddFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_AddFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        ctypes.c_void_p,
+        SilKit_EthernetFrameTransmitHandler_t,
+        SilKit_EthernetTransmitStatus,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
@@ -1879,28 +2165,32 @@ SilKit_EthernetController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_EthernetController_RemoveFrameTransmitHandler = _silkit_.SilKit_EthernetController_RemoveFrameTransmitHandler
-SilKit_EthernetController_RemoveFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_RemoveFrameTransmitHandler.argtypes = [
-    SilKit_EthernetController_p,
-    SilKit_HandlerId
-]
-SilKit_EthernetController_RemoveFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_RemoveFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_RemoveFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
     SilKit_HandlerId
 )
 
-SilKit_EthernetController_AddStateChangeHandler = _silkit_.SilKit_EthernetController_AddStateChangeHandler
-SilKit_EthernetController_AddStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_AddStateChangeHandler.argtypes = [
-    SilKit_EthernetController_p,
-    ctypes.c_void_p,
-    SilKit_EthernetStateChangeHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_EthernetController_AddStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_AddStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        ctypes.c_void_p,
+        SilKit_EthernetStateChangeHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_AddStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
@@ -1910,28 +2200,32 @@ SilKit_EthernetController_AddStateChangeHandler_t = ctypes.CFUNCTYPE(
 )
 
 
-SilKit_EthernetController_RemoveStateChangeHandler = _silkit_.SilKit_EthernetController_RemoveStateChangeHandler
-SilKit_EthernetController_RemoveStateChangeHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_RemoveStateChangeHandler.argtypes = [
-    SilKit_EthernetController_p,
-    SilKit_HandlerId
-]
-SilKit_EthernetController_RemoveStateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_RemoveStateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_RemoveStateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
     SilKit_HandlerId
 )
 
-SilKit_EthernetController_AddBitrateChangeHandler = _silkit_.SilKit_EthernetController_AddBitrateChangeHandler
-SilKit_EthernetController_AddBitrateChangeHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_AddBitrateChangeHandler.argtypes = [
-    SilKit_EthernetController_p,
-    ctypes.c_void_p,
-    SilKit_EthernetBitrateChangeHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_EthernetController_AddBitrateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_AddBitrateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        ctypes.c_void_p,
+        SilKit_EthernetBitrateChangeHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_AddBitrateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
@@ -1940,27 +2234,31 @@ SilKit_EthernetController_AddBitrateChangeHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_EthernetController_RemoveBitrateChangeHandler = _silkit_.SilKit_EthernetController_RemoveBitrateChangeHandler
-SilKit_EthernetController_RemoveBitrateChangeHandler.restype = SilKit_ReturnCode
-SilKit_EthernetController_RemoveBitrateChangeHandler.argtypes = [
-    SilKit_EthernetController_p,
-    SilKit_HandlerId
-]
-SilKit_EthernetController_RemoveBitrateChangeHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_RemoveBitrateChangeHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_RemoveBitrateChangeHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
     SilKit_HandlerId
 )
 
-SilKit_EthernetController_SendFrame = _silkit_.SilKit_EthernetController_SendFrame
-SilKit_EthernetController_SendFrame.restype = SilKit_ReturnCode
-SilKit_EthernetController_SendFrame.argtypes = [
-    SilKit_EthernetController_p,
-    ctypes.POINTER(SilKit_EthernetFrame),
-    ctypes.c_void_p
-]
-SilKit_EthernetController_SendFrame.errcheck = check_silkit_status
+_declare_(
+    "SilKit_EthernetController_SendFrame",
+    SilKit_ReturnCode,
+    [
+        SilKit_EthernetController_p,
+        ctypes.POINTER(SilKit_EthernetFrame),
+        ctypes.c_void_p
+    ],
+    check_silkit_status
+)
 SilKit_EthernetController_SendFrame_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_EthernetController_p,
@@ -2367,15 +2665,17 @@ SilKit_FlexrayCycleStartHandler_t = ctypes.CFUNCTYPE(
 )
 
 # The object returned must not be deallocated using free()!
-SilKit_FlexrayController_Create = _silkit_.SilKit_FlexrayController_Create
-SilKit_FlexrayController_Create.restype = SilKit_ReturnCode
-SilKit_FlexrayController_Create.argtypes = [
-    ctypes.POINTER(SilKit_FlexrayController_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.c_char_p
-]
-SilKit_FlexrayController_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_FlexrayController_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_FlexrayController_p),
@@ -2385,13 +2685,15 @@ SilKit_FlexrayController_Create_t = ctypes.CFUNCTYPE(
 )
 
 #Apply the given controller configuration to the controller.
-SilKit_FlexrayController_Configure = _silkit_.SilKit_FlexrayController_Configure
-SilKit_FlexrayController_Configure.restype = SilKit_ReturnCode
-SilKit_FlexrayController_Configure.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.POINTER(SilKit_FlexrayControllerConfig)
-]
-SilKit_FlexrayController_Configure.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_Configure",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.POINTER(SilKit_FlexrayControllerConfig)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_Configure_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2399,14 +2701,16 @@ SilKit_FlexrayController_Configure_t = ctypes.CFUNCTYPE(
 )
 
 #Reconfigure a TX Buffer that was previously setup with SilKit_FlexrayController_Configure()
-SilKit_FlexrayController_ReconfigureTxBuffer = _silkit_.SilKit_FlexrayController_ReconfigureTxBuffer
-SilKit_FlexrayController_ReconfigureTxBuffer.restype = SilKit_ReturnCode
-SilKit_FlexrayController_ReconfigureTxBuffer.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_uint16,
-    ctypes.POINTER(SilKit_FlexrayTxBufferConfig)
-]
-SilKit_FlexrayController_ReconfigureTxBuffer.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_ReconfigureTxBuffer",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_uint16,
+        ctypes.POINTER(SilKit_FlexrayTxBufferConfig)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_ReconfigureTxBuffer_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2419,13 +2723,15 @@ SilKit_FlexrayController_ReconfigureTxBuffer_t = ctypes.CFUNCTYPE(
 # If the buffer was configured with FlexrayTransmissionMode::SingleShot,
 # the content is sent exactly once. If it is configured as FlexrayTransmissionMode::Continuous,
 # the content is sent repeatedly according to the offset and repetition configuration.
-SilKit_FlexrayController_UpdateTxBuffer = _silkit_.SilKit_FlexrayController_UpdateTxBuffer
-SilKit_FlexrayController_UpdateTxBuffer.restype = SilKit_ReturnCode
-SilKit_FlexrayController_UpdateTxBuffer.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.POINTER(SilKit_FlexrayTxBufferUpdate)
-]
-SilKit_FlexrayController_UpdateTxBuffer.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_UpdateTxBuffer",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.POINTER(SilKit_FlexrayTxBufferUpdate)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_UpdateTxBuffer_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2433,28 +2739,32 @@ SilKit_FlexrayController_UpdateTxBuffer_t = ctypes.CFUNCTYPE(
 )
 
 # Send the given FlexrayChiCommand.
-SilKit_FlexrayController_ExecuteCmd = _silkit_.SilKit_FlexrayController_ExecuteCmd
-SilKit_FlexrayController_ExecuteCmd.restype = SilKit_ReturnCode
-SilKit_FlexrayController_ExecuteCmd.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_FlexrayChiCommand
-]
-SilKit_FlexrayController_ExecuteCmd.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_ExecuteCmd",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_FlexrayChiCommand
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_ExecuteCmd_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
     SilKit_FlexrayChiCommand
 )
 
-SilKit_FlexrayController_AddFrameHandler = _silkit_.SilKit_FlexrayController_AddFrameHandler
-SilKit_FlexrayController_AddFrameHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddFrameHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexrayFrameHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexrayFrameHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2463,28 +2773,32 @@ SilKit_FlexrayController_AddFrameHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveFrameHandler = _silkit_.SilKit_FlexrayController_RemoveFrameHandler
-SilKit_FlexrayController_RemoveFrameHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveFrameHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveFrameHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveFrameHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveFrameHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
     SilKit_HandlerId
 )
 
-SilKit_FlexrayController_AddFrameTransmitHandler = _silkit_.SilKit_FlexrayController_AddFrameTransmitHandler
-SilKit_FlexrayController_AddFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddFrameTransmitHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexrayFrameTransmitHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexrayFrameTransmitHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2493,28 +2807,32 @@ SilKit_FlexrayController_AddFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveFrameTransmitHandler = _silkit_.SilKit_FlexrayController_RemoveFrameTransmitHandler
-SilKit_FlexrayController_RemoveFrameTransmitHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveFrameTransmitHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveFrameTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveFrameTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveFrameTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
     SilKit_HandlerId
 )
 
-SilKit_FlexrayController_AddWakeupHandler = _silkit_.SilKit_FlexrayController_AddWakeupHandler
-SilKit_FlexrayController_AddWakeupHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddWakeupHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexrayWakeupHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddWakeupHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddWakeupHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexrayWakeupHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddWakeupHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2523,28 +2841,32 @@ SilKit_FlexrayController_AddWakeupHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveWakeupHandler = _silkit_.SilKit_FlexrayController_RemoveWakeupHandler
-SilKit_FlexrayController_RemoveWakeupHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveWakeupHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveWakeupHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveWakeupHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveWakeupHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
     SilKit_HandlerId
 )
 
-SilKit_FlexrayController_AddPocStatusHandler = _silkit_.SilKit_FlexrayController_AddPocStatusHandler
-SilKit_FlexrayController_AddPocStatusHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddPocStatusHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexrayPocStatusHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddPocStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddPocStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexrayPocStatusHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddPocStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2553,13 +2875,15 @@ SilKit_FlexrayController_AddPocStatusHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemovePocStatusHandler = _silkit_.SilKit_FlexrayController_RemovePocStatusHandler
-SilKit_FlexrayController_RemovePocStatusHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemovePocStatusHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemovePocStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemovePocStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemovePocStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2567,15 +2891,17 @@ SilKit_FlexrayController_RemovePocStatusHandler_t = ctypes.CFUNCTYPE(
 )
 
 #The symbols relevant for interaction trigger also an additional callback
-SilKit_FlexrayController_AddSymbolHandler = _silkit_.SilKit_FlexrayController_AddSymbolHandler
-SilKit_FlexrayController_AddSymbolHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddSymbolHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexraySymbolHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddSymbolHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddSymbolHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexraySymbolHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddSymbolHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2584,13 +2910,15 @@ SilKit_FlexrayController_AddSymbolHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveSymbolHandler = _silkit_.SilKit_FlexrayController_RemoveSymbolHandler
-SilKit_FlexrayController_RemoveSymbolHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveSymbolHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveSymbolHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveSymbolHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveSymbolHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2600,15 +2928,17 @@ SilKit_FlexrayController_RemoveSymbolHandler_t = ctypes.CFUNCTYPE(
 # Currently, the following SymbolPatterns can occur:
 #  - Wakeup() will cause sending the FlexraySymbolPattern.WUS if the bus is idle.
 #  - Run() will cause the transmission of FlexraySymbolPattern.CAS_MTS if configured to coldstart the bus.
-SilKit_FlexrayController_AddSymbolTransmitHandler = _silkit_.SilKit_FlexrayController_AddSymbolTransmitHandler
-SilKit_FlexrayController_AddSymbolTransmitHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddSymbolTransmitHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexraySymbolTransmitHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddSymbolTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddSymbolTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexraySymbolTransmitHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddSymbolTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2617,28 +2947,32 @@ SilKit_FlexrayController_AddSymbolTransmitHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveSymbolTransmitHandler = _silkit_.SilKit_FlexrayController_RemoveSymbolTransmitHandler
-SilKit_FlexrayController_RemoveSymbolTransmitHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveSymbolTransmitHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveSymbolTransmitHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveSymbolTransmitHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveSymbolTransmitHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
     SilKit_HandlerId
 )
 
-SilKit_FlexrayController_AddCycleStartHandler = _silkit_.SilKit_FlexrayController_AddCycleStartHandler
-SilKit_FlexrayController_AddCycleStartHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_AddCycleStartHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    ctypes.c_void_p,
-    SilKit_FlexrayCycleStartHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_FlexrayController_AddCycleStartHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_AddCycleStartHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        ctypes.c_void_p,
+        SilKit_FlexrayCycleStartHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_AddCycleStartHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2647,13 +2981,15 @@ SilKit_FlexrayController_AddCycleStartHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_FlexrayController_RemoveCycleStartHandler = _silkit_.SilKit_FlexrayController_RemoveCycleStartHandler
-SilKit_FlexrayController_RemoveCycleStartHandler.restype = SilKit_ReturnCode
-SilKit_FlexrayController_RemoveCycleStartHandler.argtypes = [
-    SilKit_FlexrayController_p,
-    SilKit_HandlerId
-]
-SilKit_FlexrayController_RemoveCycleStartHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_FlexrayController_RemoveCycleStartHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_FlexrayController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_FlexrayController_RemoveCycleStartHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_FlexrayController_p,
@@ -2898,15 +3234,17 @@ SilKit_Experimental_LinFrameHeaderHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Experimental_LinFrameHeaderEvent)
 )
 
-SilKit_LinController_Create = _silkit_.SilKit_LinController_Create
-SilKit_LinController_Create.restype = SilKit_ReturnCode
-SilKit_LinController_Create.argtypes = [
-    ctypes.POINTER(SilKit_LinController_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.c_char_p
-]
-SilKit_LinController_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_LinController_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p
+    ],
+    check_silkit_status
+)
 SilKit_LinController_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_LinController_p),
@@ -2915,39 +3253,45 @@ SilKit_LinController_Create_t = ctypes.CFUNCTYPE(
     ctypes.c_char_p
 )
 
-SilKit_LinController_Init = _silkit_.SilKit_LinController_Init
-SilKit_LinController_Init.restype = SilKit_ReturnCode
-SilKit_LinController_Init.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinControllerConfig)
-]
-SilKit_LinController_Init.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_Init",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinControllerConfig)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_Init_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     ctypes.POINTER(SilKit_LinControllerConfig)
 )
 
-SilKit_Experimental_LinController_InitDynamic = _silkit_.SilKit_Experimental_LinController_InitDynamic
-SilKit_Experimental_LinController_InitDynamic.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_InitDynamic.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_Experimental_LinControllerDynamicConfig)
-]
-SilKit_Experimental_LinController_InitDynamic.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_InitDynamic",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_Experimental_LinControllerDynamicConfig)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_InitDynamic_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     ctypes.POINTER(SilKit_Experimental_LinControllerDynamicConfig)
 )
 
-SilKit_LinController_SetFrameResponse = _silkit_.SilKit_LinController_SetFrameResponse
-SilKit_LinController_SetFrameResponse.restype = SilKit_ReturnCode
-SilKit_LinController_SetFrameResponse.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinFrameResponse)
-]
-SilKit_LinController_SetFrameResponse.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_SetFrameResponse",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinFrameResponse)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_SetFrameResponse_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -2955,13 +3299,15 @@ SilKit_LinController_SetFrameResponse_t = ctypes.CFUNCTYPE(
 )
 
 
-SilKit_Experimental_LinController_SendDynamicResponse = _silkit_.SilKit_Experimental_LinController_SendDynamicResponse
-SilKit_Experimental_LinController_SendDynamicResponse.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_SendDynamicResponse.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinFrame)
-]
-SilKit_Experimental_LinController_SendDynamicResponse.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_SendDynamicResponse",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinFrame)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_SendDynamicResponse_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -2969,27 +3315,31 @@ SilKit_Experimental_LinController_SendDynamicResponse_t = ctypes.CFUNCTYPE(
 )
 
 
-SilKit_LinController_Status = _silkit_.SilKit_LinController_Status
-SilKit_LinController_Status.restype = SilKit_ReturnCode
-SilKit_LinController_Status.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinControllerStatus)
-]
-SilKit_LinController_Status.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_Status",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinControllerStatus)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_Status_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     ctypes.POINTER(SilKit_LinControllerStatus)
 )
 
-SilKit_LinController_SendFrame = _silkit_.SilKit_LinController_SendFrame
-SilKit_LinController_SendFrame.restype = SilKit_ReturnCode
-SilKit_LinController_SendFrame.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinFrame),
-    SilKit_LinFrameResponseType
-]
-SilKit_LinController_SendFrame.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_SendFrame",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinFrame),
+        SilKit_LinFrameResponseType
+    ],
+    check_silkit_status
+)
 
 SilKit_LinController_SendFrame_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
@@ -2998,100 +3348,116 @@ SilKit_LinController_SendFrame_t = ctypes.CFUNCTYPE(
     SilKit_LinFrameResponseType
 )
 
-SilKit_LinController_SendFrameHeader = _silkit_.SilKit_LinController_SendFrameHeader
-SilKit_LinController_SendFrameHeader.restype = SilKit_ReturnCode
-SilKit_LinController_SendFrameHeader.argtypes = [
-    SilKit_LinController_p,
-    SilKit_LinId
-]
-SilKit_LinController_SendFrameHeader.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_SendFrameHeader",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_LinId
+    ],
+    check_silkit_status
+)
 SilKit_LinController_SendFrameHeader_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     SilKit_LinId
 )
 
-SilKit_LinController_UpdateTxBuffer = _silkit_.SilKit_LinController_UpdateTxBuffer
-SilKit_LinController_UpdateTxBuffer.restype = SilKit_ReturnCode
-SilKit_LinController_UpdateTxBuffer.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_LinFrame)
-]
-SilKit_LinController_UpdateTxBuffer.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_UpdateTxBuffer",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_LinFrame)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_UpdateTxBuffer_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     ctypes.POINTER(SilKit_LinFrame)
 )
 
-SilKit_LinController_GoToSleep = _silkit_.SilKit_LinController_GoToSleep
-SilKit_LinController_GoToSleep.restype = SilKit_ReturnCode
-SilKit_LinController_GoToSleep.argtypes = [
-    SilKit_LinController_p
-]
-SilKit_LinController_GoToSleep.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_GoToSleep",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p
+    ],
+    check_silkit_status
+)
 SilKit_LinController_GoToSleep_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p
 )
 
-SilKit_LinController_GoToSleepInternal = _silkit_.SilKit_LinController_GoToSleepInternal
-SilKit_LinController_GoToSleepInternal.restype = SilKit_ReturnCode
-SilKit_LinController_GoToSleepInternal.argtypes = [
-    SilKit_LinController_p
-]
-SilKit_LinController_GoToSleepInternal.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_GoToSleepInternal",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p
+    ],
+    check_silkit_status
+)
 SilKit_LinController_GoToSleepInternal_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p
 )
 
-SilKit_LinController_Wakeup = _silkit_.SilKit_LinController_Wakeup
-SilKit_LinController_Wakeup.restype = SilKit_ReturnCode
-SilKit_LinController_Wakeup.argtypes = [
-    SilKit_LinController_p
-]
-SilKit_LinController_Wakeup.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_Wakeup",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p
+    ],
+    check_silkit_status
+)
 SilKit_LinController_Wakeup_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p
 )
 
 
-SilKit_LinController_WakeupInternal = _silkit_.SilKit_LinController_WakeupInternal
-SilKit_LinController_WakeupInternal.restype = SilKit_ReturnCode
-SilKit_LinController_WakeupInternal.argtypes = [
-    SilKit_LinController_p
-]
-SilKit_LinController_WakeupInternal.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_WakeupInternal",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p
+    ],
+    check_silkit_status
+)
 
 SilKit_LinController_WakeupInternal_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p
 )
 
-SilKit_Experimental_LinController_GetSlaveConfiguration = _silkit_.SilKit_Experimental_LinController_GetSlaveConfiguration
-SilKit_Experimental_LinController_GetSlaveConfiguration.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_GetSlaveConfiguration.argtypes = [
-    SilKit_LinController_p,
-    ctypes.POINTER(SilKit_Experimental_LinSlaveConfiguration)
-]
-SilKit_Experimental_LinController_GetSlaveConfiguration.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_GetSlaveConfiguration",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.POINTER(SilKit_Experimental_LinSlaveConfiguration)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_GetSlaveConfiguration_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     ctypes.POINTER(SilKit_Experimental_LinSlaveConfiguration)
 )
 
-SilKit_LinController_AddFrameStatusHandler = _silkit_.SilKit_LinController_AddFrameStatusHandler
-SilKit_LinController_AddFrameStatusHandler.restype = SilKit_ReturnCode
-SilKit_LinController_AddFrameStatusHandler.argtypes = [
-    SilKit_LinController_p,
-    ctypes.c_void_p,
-    SilKit_LinFrameStatusHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_LinController_AddFrameStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_AddFrameStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.c_void_p,
+        SilKit_LinFrameStatusHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_AddFrameStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3100,13 +3466,15 @@ SilKit_LinController_AddFrameStatusHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_LinController_RemoveFrameStatusHandler = _silkit_.SilKit_LinController_RemoveFrameStatusHandler
-SilKit_LinController_RemoveFrameStatusHandler.restype = SilKit_ReturnCode
-SilKit_LinController_RemoveFrameStatusHandler.argtypes = [
-    SilKit_LinController_p,
-    SilKit_HandlerId
-]
-SilKit_LinController_RemoveFrameStatusHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_RemoveFrameStatusHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_LinController_RemoveFrameStatusHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3124,15 +3492,17 @@ SilKit_LinController_RemoveFrameStatusHandler_t = ctypes.CFUNCTYPE(
 # treated like every other frame, i.e. the SilKit_LinFrameStatusHandler is
 # only called for LIN ID 0x3C if configured as
 # SilKit_LinFrameResponseMode_Rx.
-SilKit_LinController_AddGoToSleepHandler = _silkit_.SilKit_LinController_AddGoToSleepHandler
-SilKit_LinController_AddGoToSleepHandler.restype = SilKit_ReturnCode
-SilKit_LinController_AddGoToSleepHandler.argtypes = [
-    SilKit_LinController_p,
-    ctypes.c_void_p,
-    SilKit_LinGoToSleepHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_LinController_AddGoToSleepHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_AddGoToSleepHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.c_void_p,
+        SilKit_LinGoToSleepHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_AddGoToSleepHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3141,13 +3511,15 @@ SilKit_LinController_AddGoToSleepHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_LinController_RemoveGoToSleepHandler = _silkit_.SilKit_LinController_RemoveGoToSleepHandler
-SilKit_LinController_RemoveGoToSleepHandler.restype = SilKit_ReturnCode
-SilKit_LinController_RemoveGoToSleepHandler.argtypes = [
-    SilKit_LinController_p,
-    SilKit_HandlerId
-]
-SilKit_LinController_RemoveGoToSleepHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_RemoveGoToSleepHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_LinController_RemoveGoToSleepHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3158,15 +3530,17 @@ SilKit_LinController_RemoveGoToSleepHandler_t = ctypes.CFUNCTYPE(
 # Note: The LIN controller does not automatically enter
 # operational mode on wake up pulse detection. I.e.,
 # WakeInternal() must be called manually.
-SilKit_LinController_AddWakeupHandler = _silkit_.SilKit_LinController_AddWakeupHandler
-SilKit_LinController_AddWakeupHandler.restype = SilKit_ReturnCode
-SilKit_LinController_AddWakeupHandler.argtypes = [
-    SilKit_LinController_p,
-    ctypes.c_void_p,
-    SilKit_LinWakeupHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_LinController_AddWakeupHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_AddWakeupHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.c_void_p,
+        SilKit_LinWakeupHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_LinController_AddWakeupHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3175,13 +3549,15 @@ SilKit_LinController_AddWakeupHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_LinController_RemoveWakeupHandler = _silkit_.SilKit_LinController_RemoveWakeupHandler
-SilKit_LinController_RemoveWakeupHandler.restype = SilKit_ReturnCode
-SilKit_LinController_RemoveWakeupHandler.argtypes = [
-    SilKit_LinController_p,
-    SilKit_HandlerId
-]
-SilKit_LinController_RemoveWakeupHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_LinController_RemoveWakeupHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_LinController_RemoveWakeupHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3193,15 +3569,17 @@ SilKit_LinController_RemoveWakeupHandler_t = ctypes.CFUNCTYPE(
 # It can be used to call SilKit_Experimental_LinController_GetSlaveConfiguration to keep track of LIN Ids, where
 # a response of a LIN Slave is to be expected.
 # Requires SilKit_LinControllerMode_Master
-SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler = _silkit_.SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler
-SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler.argtypes = [
-    SilKit_LinController_p,
-    ctypes.c_void_p,
-    SilKit_Experimental_LinSlaveConfigurationHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.c_void_p,
+        SilKit_Experimental_LinSlaveConfigurationHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3210,28 +3588,32 @@ SilKit_Experimental_LinController_AddLinSlaveConfigurationHandler_t = ctypes.CFU
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler = _silkit_.SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler
-SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler.argtypes = [
-    SilKit_LinController_p,
-    SilKit_HandlerId
-]
-SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_RemoveLinSlaveConfigurationHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
     SilKit_HandlerId
 )
 
-SilKit_Experimental_LinController_AddFrameHeaderHandler = _silkit_.SilKit_Experimental_LinController_AddFrameHeaderHandler
-SilKit_Experimental_LinController_AddFrameHeaderHandler.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_AddFrameHeaderHandler.argtypes = [
-    SilKit_LinController_p,
-    ctypes.c_void_p,
-    SilKit_Experimental_LinFrameHeaderHandler_t,
-    ctypes.POINTER(SilKit_HandlerId)
-]
-SilKit_Experimental_LinController_AddFrameHeaderHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_AddFrameHeaderHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        ctypes.c_void_p,
+        SilKit_Experimental_LinFrameHeaderHandler_t,
+        ctypes.POINTER(SilKit_HandlerId)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_AddFrameHeaderHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3240,13 +3622,15 @@ SilKit_Experimental_LinController_AddFrameHeaderHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_HandlerId)
 )
 
-SilKit_Experimental_LinController_RemoveFrameHeaderHandler = _silkit_.SilKit_Experimental_LinController_RemoveFrameHeaderHandler
-SilKit_Experimental_LinController_RemoveFrameHeaderHandler.restype = SilKit_ReturnCode
-SilKit_Experimental_LinController_RemoveFrameHeaderHandler.argtypes = [
-    SilKit_LinController_p,
-    SilKit_HandlerId
-]
-SilKit_Experimental_LinController_RemoveFrameHeaderHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinController_RemoveFrameHeaderHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_LinController_p,
+        SilKit_HandlerId
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinController_RemoveFrameHeaderHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_LinController_p,
@@ -3287,16 +3671,18 @@ SilKit_DataMessageHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_DataMessageEvent)
 )
 
-SilKit_DataPublisher_Create = _silkit_.SilKit_DataPublisher_Create
-SilKit_DataPublisher_Create.restype = SilKit_ReturnCode
-SilKit_DataPublisher_Create.argtypes = [
-    ctypes.POINTER(SilKit_DataPublisher_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(SilKit_DataSpec),
-    ctypes.c_ubyte
-]
-SilKit_DataPublisher_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_DataPublisher_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_DataPublisher_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(SilKit_DataSpec),
+        ctypes.c_ubyte
+    ],
+    check_silkit_status
+)
 SilKit_DataPublisher_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_DataPublisher_p),
@@ -3306,17 +3692,19 @@ SilKit_DataPublisher_Create_t = ctypes.CFUNCTYPE(
     ctypes.c_ubyte
 )
 
-SilKit_DataSubscriber_Create = _silkit_.SilKit_DataSubscriber_Create
-SilKit_DataSubscriber_Create.restype = SilKit_ReturnCode
-SilKit_DataSubscriber_Create.argtypes = [
-    ctypes.POINTER(SilKit_DataSubscriber_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(SilKit_DataSpec),
-    ctypes.c_void_p,
-    SilKit_DataMessageHandler_t
-]
-SilKit_DataSubscriber_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_DataSubscriber_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_DataSubscriber_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(SilKit_DataSpec),
+        ctypes.c_void_p,
+        SilKit_DataMessageHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_DataSubscriber_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_DataSubscriber_p),
@@ -3327,27 +3715,31 @@ SilKit_DataSubscriber_Create_t = ctypes.CFUNCTYPE(
     SilKit_DataMessageHandler_t
 )
 
-SilKit_DataPublisher_Publish = _silkit_.SilKit_DataPublisher_Publish
-SilKit_DataPublisher_Publish.restype = SilKit_ReturnCode
-SilKit_DataPublisher_Publish.argtypes = [
-    SilKit_DataPublisher_p,
-    ctypes.POINTER(SilKit_ByteVector),
-]
-SilKit_DataPublisher_Publish.errcheck = check_silkit_status
+_declare_(
+    "SilKit_DataPublisher_Publish",
+    SilKit_ReturnCode,
+    [
+        SilKit_DataPublisher_p,
+        ctypes.POINTER(SilKit_ByteVector),
+    ],
+    check_silkit_status
+)
 SilKit_DataPublisher_Publish_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_DataPublisher_p,
     ctypes.POINTER(SilKit_ByteVector)
 )
 
-SilKit_DataSubscriber_SetDataMessageHandler = _silkit_.SilKit_DataSubscriber_SetDataMessageHandler
-SilKit_DataSubscriber_SetDataMessageHandler.restype = SilKit_ReturnCode
-SilKit_DataSubscriber_SetDataMessageHandler.argtypes = [
-    SilKit_DataSubscriber_p,
-    ctypes.c_void_p,
-    SilKit_DataMessageHandler_t
-]
-SilKit_DataSubscriber_SetDataMessageHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_DataSubscriber_SetDataMessageHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_DataSubscriber_p,
+        ctypes.c_void_p,
+        SilKit_DataMessageHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_DataSubscriber_SetDataMessageHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_DataSubscriber_p,
@@ -3379,14 +3771,16 @@ class  SilKit_Experimental_EventReceivers(ctypes.Structure):
         ("controllerDescriptors", ctypes.POINTER(SilKit_Experimental_ControllerDescriptor))
     ]
 
-SilKit_Experimental_CanEventProducer_Produce = _silkit_.SilKit_Experimental_CanEventProducer_Produce
-SilKit_Experimental_CanEventProducer_Produce.restype = SilKit_ReturnCode
-SilKit_Experimental_CanEventProducer_Produce.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_CanEventProducer),
-    ctypes.POINTER(SilKit_StructHeader),
-    ctypes.POINTER(SilKit_Experimental_EventReceivers),
-]
-SilKit_Experimental_CanEventProducer_Produce.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_CanEventProducer_Produce",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_CanEventProducer),
+        ctypes.POINTER(SilKit_StructHeader),
+        ctypes.POINTER(SilKit_Experimental_EventReceivers),
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_CanEventProducer_Produce_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_CanEventProducer),
@@ -3394,14 +3788,16 @@ SilKit_Experimental_CanEventProducer_Produce_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Experimental_EventReceivers)
 )
 
-SilKit_Experimental_FlexRayEventProducer_Produce = _silkit_.SilKit_Experimental_FlexRayEventProducer_Produce
-SilKit_Experimental_FlexRayEventProducer_Produce.restype = SilKit_ReturnCode
-SilKit_Experimental_FlexRayEventProducer_Produce.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_FlexRayEventProducer),
-    ctypes.POINTER(SilKit_StructHeader),
-    ctypes.POINTER(SilKit_Experimental_EventReceivers),
-]
-SilKit_Experimental_FlexRayEventProducer_Produce.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_FlexRayEventProducer_Produce",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_FlexRayEventProducer),
+        ctypes.POINTER(SilKit_StructHeader),
+        ctypes.POINTER(SilKit_Experimental_EventReceivers),
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_FlexRayEventProducer_Produce_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_FlexRayEventProducer),
@@ -3409,14 +3805,16 @@ SilKit_Experimental_FlexRayEventProducer_Produce_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Experimental_EventReceivers)
 )
 
-SilKit_Experimental_EthernetEventProducer_Produce = _silkit_.SilKit_Experimental_EthernetEventProducer_Produce
-SilKit_Experimental_EthernetEventProducer_Produce.restype = SilKit_ReturnCode
-SilKit_Experimental_EthernetEventProducer_Produce.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_EthernetEventProducer),
-    ctypes.POINTER(SilKit_StructHeader),
-    ctypes.POINTER(SilKit_Experimental_EventReceivers),
-]
-SilKit_Experimental_EthernetEventProducer_Produce.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_EthernetEventProducer_Produce",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_EthernetEventProducer),
+        ctypes.POINTER(SilKit_StructHeader),
+        ctypes.POINTER(SilKit_Experimental_EventReceivers),
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_EthernetEventProducer_Produce_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_EthernetEventProducer),
@@ -3424,14 +3822,16 @@ SilKit_Experimental_EthernetEventProducer_Produce_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Experimental_EventReceivers)
 )
 
-SilKit_Experimental_LinEventProducer_Produce = _silkit_.SilKit_Experimental_LinEventProducer_Produce
-SilKit_Experimental_LinEventProducer_Produce.restype = SilKit_ReturnCode
-SilKit_Experimental_LinEventProducer_Produce.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_LinEventProducer),
-    ctypes.POINTER(SilKit_StructHeader),
-    ctypes.POINTER(SilKit_Experimental_EventReceivers),
-]
-SilKit_Experimental_LinEventProducer_Produce.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_LinEventProducer_Produce",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_LinEventProducer),
+        ctypes.POINTER(SilKit_StructHeader),
+        ctypes.POINTER(SilKit_Experimental_EventReceivers),
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_LinEventProducer_Produce_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_LinEventProducer),
@@ -3503,17 +3903,19 @@ SilKit_RpcCallResultHandler_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_RpcCallResultEvent)
 )
 
-SilKit_RpcServer_Create = _silkit_.SilKit_RpcServer_Create
-SilKit_RpcServer_Create.restype = SilKit_ReturnCode
-SilKit_RpcServer_Create.argtypes = [
-    ctypes.POINTER(SilKit_RpcServer_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(SilKit_RpcSpec),
-    ctypes.c_void_p,
-    SilKit_RpcCallHandler_t
-]
-SilKit_RpcServer_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcServer_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_RpcServer_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(SilKit_RpcSpec),
+        ctypes.c_void_p,
+        SilKit_RpcCallHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_RpcServer_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_RpcServer_p),
@@ -3524,14 +3926,16 @@ SilKit_RpcServer_Create_t = ctypes.CFUNCTYPE(
     SilKit_RpcCallHandler_t
 )
 
-SilKit_RpcServer_SubmitResult = _silkit_.SilKit_RpcServer_SubmitResult
-SilKit_RpcServer_SubmitResult.restype = SilKit_ReturnCode
-SilKit_RpcServer_SubmitResult.argtypes = [
-    SilKit_RpcServer_p,
-    SilKit_RpcCallHandle_p,
-    ctypes.POINTER(SilKit_ByteVector),
-]
-SilKit_RpcServer_SubmitResult.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcServer_SubmitResult",
+    SilKit_ReturnCode,
+    [
+        SilKit_RpcServer_p,
+        SilKit_RpcCallHandle_p,
+        ctypes.POINTER(SilKit_ByteVector),
+    ],
+    check_silkit_status
+)
 SilKit_RpcServer_SubmitResult_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_RpcServer_p,
@@ -3539,14 +3943,16 @@ SilKit_RpcServer_SubmitResult_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_ByteVector)
 )
 
-SilKit_RpcServer_SetCallHandler = _silkit_.SilKit_RpcServer_SetCallHandler
-SilKit_RpcServer_SetCallHandler.restype = SilKit_ReturnCode
-SilKit_RpcServer_SetCallHandler.argtypes = [
-    SilKit_RpcServer_p,
-    ctypes.c_void_p,
-    SilKit_RpcCallHandler_t
-]
-SilKit_RpcServer_SetCallHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcServer_SetCallHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_RpcServer_p,
+        ctypes.c_void_p,
+        SilKit_RpcCallHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_RpcServer_SetCallHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_RpcServer_p,
@@ -3554,17 +3960,19 @@ SilKit_RpcServer_SetCallHandler_t = ctypes.CFUNCTYPE(
     SilKit_RpcCallHandler_t
 )
 
-SilKit_RpcClient_Create = _silkit_.SilKit_RpcClient_Create
-SilKit_RpcClient_Create.restype = SilKit_ReturnCode
-SilKit_RpcClient_Create.argtypes = [
-    ctypes.POINTER(SilKit_RpcClient_p),
-    SilKit_Participant_p,
-    ctypes.c_char_p,
-    ctypes.POINTER(SilKit_RpcSpec),
-    ctypes.c_void_p,
-    SilKit_RpcCallResultHandler_t
-]
-SilKit_RpcClient_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcClient_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_RpcClient_p),
+        SilKit_Participant_p,
+        ctypes.c_char_p,
+        ctypes.POINTER(SilKit_RpcSpec),
+        ctypes.c_void_p,
+        SilKit_RpcCallResultHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_RpcClient_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_RpcClient_p),
@@ -3575,14 +3983,16 @@ SilKit_RpcClient_Create_t = ctypes.CFUNCTYPE(
     SilKit_RpcCallResultHandler_t
 )
 
-SilKit_RpcClient_Call = _silkit_.SilKit_RpcClient_Call
-SilKit_RpcClient_Call.restype = SilKit_ReturnCode
-SilKit_RpcClient_Call.argtypes = [
-    SilKit_RpcClient_p,
-    ctypes.POINTER(SilKit_ByteVector),
-    ctypes.c_void_p
-]
-SilKit_RpcClient_Call.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcClient_Call",
+    SilKit_ReturnCode,
+    [
+        SilKit_RpcClient_p,
+        ctypes.POINTER(SilKit_ByteVector),
+        ctypes.c_void_p
+    ],
+    check_silkit_status
+)
 SilKit_RpcClient_Call_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_RpcClient_p,
@@ -3590,15 +4000,17 @@ SilKit_RpcClient_Call_t = ctypes.CFUNCTYPE(
     ctypes.c_void_p
 )
 
-SilKit_RpcClient_CallWithTimeout = _silkit_.SilKit_RpcClient_CallWithTimeout
-SilKit_RpcClient_CallWithTimeout.restype = SilKit_ReturnCode
-SilKit_RpcClient_CallWithTimeout.argtypes = [
-    SilKit_RpcClient_p,
-    ctypes.POINTER(SilKit_ByteVector),
-    SilKit_NanosecondsTime,
-    ctypes.c_void_p
-]
-SilKit_RpcClient_CallWithTimeout.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcClient_CallWithTimeout",
+    SilKit_ReturnCode,
+    [
+        SilKit_RpcClient_p,
+        ctypes.POINTER(SilKit_ByteVector),
+        SilKit_NanosecondsTime,
+        ctypes.c_void_p
+    ],
+    check_silkit_status
+)
 SilKit_RpcClient_CallWithTimeout_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_RpcClient_p,
@@ -3607,14 +4019,16 @@ SilKit_RpcClient_CallWithTimeout_t = ctypes.CFUNCTYPE(
     ctypes.c_void_p
 )
 
-SilKit_RpcClient_SetCallResultHandler = _silkit_.SilKit_RpcClient_SetCallResultHandler
-SilKit_RpcClient_SetCallResultHandler.restype = SilKit_ReturnCode
-SilKit_RpcClient_SetCallResultHandler.argtypes = [
-    SilKit_RpcClient_p,
-    ctypes.c_void_p,
-    SilKit_RpcCallResultHandler_t
-]
-SilKit_RpcClient_SetCallResultHandler.errcheck = check_silkit_status
+_declare_(
+    "SilKit_RpcClient_SetCallResultHandler",
+    SilKit_ReturnCode,
+    [
+        SilKit_RpcClient_p,
+        ctypes.c_void_p,
+        SilKit_RpcCallResultHandler_t
+    ],
+    check_silkit_status
+)
 SilKit_RpcClient_SetCallResultHandler_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_RpcClient_p,
@@ -3943,29 +4357,33 @@ class SilKit_Experimental_SimulatedLinControllerFunctions(ctypes.Structure):
         ("OnControllerStatusUpdate", SilKit_Experimental_SimulatedLin_OnControllerStatusUpdate_t)
     ]
 
-SilKit_Experimental_NetworkSimulator_Create = _silkit_.SilKit_Experimental_NetworkSimulator_Create
-SilKit_Experimental_NetworkSimulator_Create.restype = SilKit_ReturnCode
-SilKit_Experimental_NetworkSimulator_Create.argtypes = [
-    ctypes.POINTER(SilKit_Experimental_NetworkSimulator_p),
-    SilKit_Participant_p
-]
-SilKit_Experimental_NetworkSimulator_Create.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_NetworkSimulator_Create",
+    SilKit_ReturnCode,
+    [
+        ctypes.POINTER(SilKit_Experimental_NetworkSimulator_p),
+        SilKit_Participant_p
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_NetworkSimulator_Create_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     ctypes.POINTER(SilKit_Experimental_NetworkSimulator_p),
     SilKit_Participant_p
 )
 
-SilKit_Experimental_NetworkSimulator_SimulateNetwork = _silkit_.SilKit_Experimental_NetworkSimulator_SimulateNetwork
-SilKit_Experimental_NetworkSimulator_SimulateNetwork.restype = SilKit_ReturnCode
-SilKit_Experimental_NetworkSimulator_SimulateNetwork.argtypes = [
-    SilKit_Experimental_NetworkSimulator_p,
-    ctypes.c_char_p,
-    SilKit_Experimental_SimulatedNetworkType,
-    ctypes.c_void_p,
-    ctypes.POINTER(SilKit_Experimental_SimulatedNetworkFunctions)
-]
-SilKit_Experimental_NetworkSimulator_SimulateNetwork.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_NetworkSimulator_SimulateNetwork",
+    SilKit_ReturnCode,
+    [
+        SilKit_Experimental_NetworkSimulator_p,
+        ctypes.c_char_p,
+        SilKit_Experimental_SimulatedNetworkType,
+        ctypes.c_void_p,
+        ctypes.POINTER(SilKit_Experimental_SimulatedNetworkFunctions)
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_NetworkSimulator_SimulateNetwork_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Experimental_NetworkSimulator_p,
@@ -3975,12 +4393,14 @@ SilKit_Experimental_NetworkSimulator_SimulateNetwork_t = ctypes.CFUNCTYPE(
     ctypes.POINTER(SilKit_Experimental_SimulatedNetworkFunctions)
 )
 
-SilKit_Experimental_NetworkSimulator_Start = _silkit_.SilKit_Experimental_NetworkSimulator_Start
-SilKit_Experimental_NetworkSimulator_Start.restype = SilKit_ReturnCode
-SilKit_Experimental_NetworkSimulator_Start.argtypes = [
-    SilKit_Experimental_NetworkSimulator_p
-]
-SilKit_Experimental_NetworkSimulator_Start.errcheck = check_silkit_status
+_declare_(
+    "SilKit_Experimental_NetworkSimulator_Start",
+    SilKit_ReturnCode,
+    [
+        SilKit_Experimental_NetworkSimulator_p
+    ],
+    check_silkit_status
+)
 SilKit_Experimental_NetworkSimulator_Start_t = ctypes.CFUNCTYPE(
     SilKit_ReturnCode,
     SilKit_Experimental_NetworkSimulator_p
@@ -0,0 +1,78 @@
+import collections
+import enum
+import threading
+
+class OverflowPolicy(enum.IntEnum):
+    DROP_OLDEST = 0 # Evict the oldest item to make room for the new one
+    DROP_NEWEST = 1 # Discard the new item
+    BLOCK = 2 # Block the producer (i.e. the SilKit callback) until there is room
+
+class MessageQueue(object):
+    def __init__(
+        self,
+        maxlen: int = 2000,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    ):
+        self.maxlen = maxlen
+        self.overflow = OverflowPolicy(overflow)
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # Counters are only modified while holding the lock
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def _is_full(self):
+        return self.maxlen is not None and len(self._queue) >= self.maxlen
+
+    def put(self, item):
+        with self._lock:
+            if self.maxlen == 0:
+                # A queue without capacity drops every item regardless of the policy
+                self.dropped += 1
+                return False
+            if self._is_full():
+                if self.overflow == OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.overflow == OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                else:
+                    self._not_full.wait_for(lambda: not self._is_full())
+            self._queue.append(item)
+            self.enqueued += 1
+            self._not_empty.notify()
+        return True
+
+    def get(self, timeout: float = 0.0):
+        # timeout=0 polls, timeout=None blocks until an item arrives.
+        # Raises IndexError if no item is available in time.
+        with self._lock:
+            if not self._queue and timeout != 0:
+                self._not_empty.wait_for(lambda: self._queue, timeout)
+            item = self._queue.popleft()
+            self.dequeued += 1
+            self._not_full.notify()
+        return item
+
+    def clear(self):
+        with self._lock:
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            self._not_full.notify_all()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._queue),
+                "maxlen": self.maxlen,
+                "enqueued": self.enqueued,
+                "dequeued": self.dequeued,
+                "dropped": self.dropped,
+            }
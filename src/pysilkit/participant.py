@@ -1,12 +1,16 @@
 import ctypes
 import enum
+import threading
 
 from typing import Union
 
 from .library import silkitapi
 from .can_controller import SilKitCanController
+from .configuration import ParticipantConfiguration
 from .publisher import SilKitPublisher
 from .subscriber import SilKitSubscriber
+from .time_slave import SilKitTimeSlave
+from .time_sync import SilKitTimeSync
 
 class CommunicationSystem(enum.IntEnum):
     CAN = 0
@@ -23,8 +27,11 @@ class SilKitParticipant(object):
     def __init__(
         self,
         name = None,
-        port = 8500
+        port = 8500,
+        log_level: silkitapi.SilKitLoggingLevel = silkitapi.SilKitLoggingLevel.INFO,
+        config: ParticipantConfiguration = None
     ):
+        # log_level is only used when no configuration is given
         listen_uri = f"silkit://localhost:{port}"
         if name is None:
             self.name = f"Participant_{self.__counter__}"
@@ -35,37 +42,15 @@ class SilKitParticipant(object):
             raise ValueError(f"{self.name} already exists")
         else:
             self.__names__.add(self.name)
+            self.__owns_name__ = True
         self.communication_controllers = {key: {} for key in CommunicationSystem}
-        config = f"""
----
-Description: Configuration of {self.name}
-SchemaVersion: 1
-ParticipantName: {self.name}
-Logging:
-  Sinks:
-  - Type: File
-    Level: Trace
-    LogName: Log_
-  FlushLevel: Trace
-  LogFromRemotes: false
-HealthCheck:
-  SoftResponseTimeout: 500
-  HardResponseTimeout: 5000
-Middleware:
-  RegistryUri: {listen_uri}
-  ConnectAttempts: 9
-  TcpNoDelay: true
-  TcpQuickAck: true
-  EnableDomainSockets: false
-  TcpSendBufferSize: 3456
-  TcpReceiveBufferSize: 3456
-  RegistryAsFallbackProxy: false
-  ConnectTimeoutSeconds: 1.234
-"""
+        if config is None:
+            config = ParticipantConfiguration(log_level=log_level)
+        self.config = config
         self.instance_config =  silkitapi.SilKit_ParticipantConfiguration_p()
         silkitapi.SilKit_ParticipantConfiguration_FromString(
             ctypes.byref(self.instance_config),
-            config.encode()
+            config.to_yaml(self.name, listen_uri).encode()
         )
         self.instance = silkitapi.SilKit_Participant_p()
         silkitapi.SilKit_Participant_Create(
@@ -74,17 +59,38 @@ Middleware:
             self.name.encode(),
             listen_uri.encode(),
         )
+        #Failed native calls name the participant they were made for
+        silkitapi.register_owner(self.instance, self.name)
         self.__logger__ = silkitapi.SilKit_Logger_p()
         silkitapi.SilKit_Participant_GetLogger(
             ctypes.byref(self.__logger__),
             self.instance
         )
+        # The level is cached so hot paths can skip disabled log calls
+        # without a native call or encoding the text
+        level = silkitapi.SilKit_LoggingLevel()
+        silkitapi.SilKit_Logger_GetLogLevel(self.__logger__, ctypes.byref(level))
+        self.log_level = silkitapi.SilKitLoggingLevel(level.value)
+        self.__time_slave__ = None
+        self.__time_slave_lock__ = threading.Lock()
+        self.time_sync = None
 
     def __del__(self):
+        #The name is free again, unless __init__ failed because it was taken
+        if getattr(self, "__owns_name__", False):
+            self.__names__.discard(self.name)
+        if not hasattr(self, "instance"):
+            return
+        silkitapi.unregister_owner(self.instance)
         silkitapi.SilKit_Participant_Destroy(self.instance)
         silkitapi.SilKit_ParticipantConfiguration_Destroy(self.instance_config)
 
+    def is_enabled_for(self, level:silkitapi.SilKitLoggingLevel):
+        return self.log_level != silkitapi.SilKitLoggingLevel.OFF and level >= self.log_level
+
     def _log_(self, level:silkitapi.SilKitLoggingLevel, text:str):
+        if not self.is_enabled_for(level):
+            return
         silkitapi.SilKit_Logger_Log(
             self.__logger__,
             level,
@@ -109,6 +115,33 @@ Middleware:
     def critical(self, text:str):
         self._log_(silkitapi.SilKitLoggingLevel.CRITICAL, text)
 
+    @property
+    def time_slave(self):
+        # One GLOBAL_SYNC_TIME subscription per participant, shared by all
+        # controllers and created on first use
+        if self.__time_slave__ is None:
+            with self.__time_slave_lock__:
+                if self.__time_slave__ is None:
+                    self.__time_slave__ = SilKitTimeSlave(self, self.name)
+        return self.__time_slave__
+
+    def add_time_sync(
+        self,
+        step_size: int = 1000000,
+        handler = None,
+        *,
+        asynchronous: bool = False,
+        operation_mode: silkitapi.SilKitOperationMode = silkitapi.SilKitOperationMode.COORDINATED
+    ):
+        # Runs the participant in virtual time with steps of step_size nanoseconds,
+        # handler(now, duration) is called for every step
+        if self.time_sync is not None:
+            raise ValueError(f"{self.name} already has a time sync service")
+        self.time_sync = SilKitTimeSync(
+            self, step_size, handler, asynchronous=asynchronous, operation_mode=operation_mode
+        )
+        return self.time_sync
+
     def _add_controller_(self, controller_type: CommunicationSystem, name, *args, **kwargs):
         controllers = self.communication_controllers[controller_type]
         if controller_type == CommunicationSystem.CAN:
@@ -135,8 +168,8 @@ Middleware:
         except KeyError:
             raise ValueError(f"Controller '{controller_type.name}' {key} does not exist!")
 
-    def add_can_controller(self, name, network="VIRTUAL"):
-        self._add_controller_(CommunicationSystem.CAN, name, network)
+    def add_can_controller(self, name, network="VIRTUAL", **kwargs):
+        self._add_controller_(CommunicationSystem.CAN, name, network, **kwargs)
 
     def can(self, i: Union[int, str]):
         return self._get_controller_(CommunicationSystem.CAN, i)
@@ -34,6 +34,7 @@ class SilKitPublisher(object):
             ctypes.byref(self.data_spec),
             int(history)
         )
+        silkitapi.register_owner(self.instance, f"{participant.name}/{self.name}", participant.instance)
 
     def publish(self, data):
         byte_vector = silkitapi.SilKit_ByteVector.from_sequence(data)
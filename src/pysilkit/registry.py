@@ -0,0 +1,62 @@
+import ctypes
+import threading
+
+from .library import silkitapi
+from .utilities import py2ct, auto_context
+
+class SilKitRegistry(object):
+    @silkitapi.SilKit_Vendor_Vector_SilKitRegistry_AllDisconnectedHandler_t
+    @staticmethod
+    @auto_context
+    def on_all_disconnected(self, registry):
+        self.all_disconnected.set()
+        return silkitapi.SiKitReturnCode.SUCCESS
+
+    def __init__(
+        self,
+        listen_uri: str = "silkit://localhost:8500",
+        *,
+        log_level: silkitapi.SilKitLoggingLevel = silkitapi.SilKitLoggingLevel.WARN
+    ):
+        # Runs the registry inside this process, a port of 0 lets the OS pick one
+        level_name = silkitapi.SilKitLoggingLevel(log_level).name.capitalize()
+        config = f"""
+---
+Description: Configuration of the embedded SilKit registry
+SchemaVersion: 1
+Logging:
+  Sinks:
+  - Type: Stdout
+    Level: {level_name}
+"""
+        self.instance_config = silkitapi.SilKit_ParticipantConfiguration_p()
+        silkitapi.SilKit_ParticipantConfiguration_FromString(
+            ctypes.byref(self.instance_config),
+            config.encode()
+        )
+        self.instance = silkitapi.SilKit_Vendor_Vector_SilKitRegistry_p()
+        silkitapi.SilKit_Vendor_Vector_SilKitRegistry_Create(
+            ctypes.byref(self.instance),
+            self.instance_config
+        )
+        self.all_disconnected = threading.Event()
+        #Wrap self into ctypes
+        self.__self = py2ct(self)
+        silkitapi.SilKit_Vendor_Vector_SilKitRegistry_SetAllDisconnectedHandler(
+            self.instance,
+            self.__self,
+            self.on_all_disconnected
+        )
+        #Returns once the registry is listening, with the URI it is bound to
+        registry_uri = ctypes.c_char_p()
+        silkitapi.SilKit_Vendor_Vector_SilKitRegistry_StartListening(
+            self.instance,
+            listen_uri.encode(),
+            ctypes.byref(registry_uri)
+        )
+        self.uri = registry_uri.value.decode()
+        self.port = int(self.uri.rstrip("/").rsplit(":", 1)[1])
+
+    def __del__(self):
+        silkitapi.SilKit_Vendor_Vector_SilKitRegistry_Destroy(self.instance)
+        silkitapi.SilKit_ParticipantConfiguration_Destroy(self.instance_config)
@@ -0,0 +1,116 @@
+import functools
+import queue
+import threading
+import time
+import traceback
+
+class StepStatistics(object):
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0 # nanoseconds
+        self.min = None
+        self.max = None
+
+    def add(self, duration: int):
+        self.count += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if self.max is None or duration > self.max:
+            self.max = duration
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def __str__(self):
+        if not self.count:
+            return "no steps"
+        return (
+            f"{self.count} steps, mean {self.mean / 1e3:.1f}us, "
+            f"min {self.min / 1e3:.1f}us, max {self.max / 1e3:.1f}us"
+        )
+
+class _ScheduledParticipant(object):
+    def __init__(self, participant, tasks):
+        self.participant = participant
+        self.tasks = list(tasks)
+        self.statistics = StepStatistics()
+
+class SilKitScheduler(object):
+    # Runs the per step work of many participants of this process and
+    # completes each step as soon as its tasks are done, so virtual time
+    # advances as fast as the tasks allow instead of at wall clock pace.
+    def __init__(self):
+        self._participants = {}
+        self._work = queue.SimpleQueue()
+        self._worker = None
+        self.errors = []
+
+    def register(self, participant, step_size: int, *tasks):
+        # Every task is called with (now, duration) in nanoseconds
+        entry = _ScheduledParticipant(participant, tasks)
+        participant.add_time_sync(
+            step_size,
+            functools.partial(self._on_step_, entry),
+            asynchronous=True
+        )
+        self._participants[participant.name] = entry
+        return participant.time_sync
+
+    def add_task(self, participant, task):
+        self._participants[participant.name].tasks.append(task)
+
+    def _on_step_(self, entry, now, duration):
+        #Called on a SilKit thread, the tasks run on the worker
+        self._work.put((entry, now, duration))
+
+    def _run_(self):
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            entry, now, duration = item
+            tmp = time.perf_counter_ns()
+            try:
+                for task in entry.tasks:
+                    task(now, duration)
+            except Exception:
+                error = traceback.format_exc()
+                self.errors.append((entry.participant.name, now, error))
+                entry.participant.time_sync.report_error(error)
+                continue
+            entry.statistics.add(time.perf_counter_ns() - tmp)
+            entry.participant.time_sync.complete_step()
+
+    def start(self):
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_,
+                name=f"{self.__class__.__name__}Worker",
+                daemon=True
+            )
+            self._worker.start()
+        for entry in self._participants.values():
+            entry.participant.time_sync.start()
+
+    def stop(self, reason: str = "Stopped by scheduler"):
+        for entry in self._participants.values():
+            entry.participant.time_sync.stop(reason)
+
+    def wait(self):
+        #Blocks until all lifecycles have finished and shuts down the worker
+        states = {
+            name: entry.participant.time_sync.wait()
+            for name, entry in self._participants.items()
+        }
+        if self._worker is not None:
+            self._work.put(None)
+            self._worker.join()
+            self._worker = None
+        return states
+
+    def statistics(self):
+        return {name: entry.statistics for name, entry in self._participants.items()}
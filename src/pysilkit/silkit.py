@@ -1,26 +1,66 @@
 import ctypes
+import itertools
 import pathlib
+import socket
 import subprocess
 import time
+import urllib.parse
 
 from .library import silkitapi
 from .time_master import SilKitTimeMaster
+from .registry import SilKitRegistry
+from .configuration import ParticipantConfiguration
+from .participant import SilKitParticipant
+from .system_monitor import SilKitSystemMonitor
 
 _base_path_ = pathlib.Path(__file__).parent
 
 class SilKit(object):
-    def __init__(self, *participants, port=8500, launch_monitor=False):
+    __counter__ = itertools.count(1)
+
+    def __init__(
+        self,
+        *participants,
+        port=8500,
+        launch_monitor=False,
+        embedded_registry=False,
+        startup_timeout=10.0,
+        time_sync_interval=1.0,
+        single_host=False
+    ):
+        # All components are launched right away and then awaited on their
+        # readiness: the registry accepting connections and the others
+        # connecting to it as seen by a system monitor in this process
+        tmp = time.perf_counter()
+        deadline = tmp + startup_timeout
+        self.startup_timings = {}
         self.listen_uri = f"silkit://localhost:{port}"
-        # Start the Middleware Registry
-        self.mw_log = open("sil_kit_registry.log", "w")
-        self.middleware = subprocess.Popen(
-            [
-                str(_base_path_ / "library/sil-kit-registry.exe"),
-                "--listen-uri", self.listen_uri,
-                "--log", "trace" # trace, debug, warn, info, error, critical or off
-             ],
-            stdout=self.mw_log
-        )
+        self.embedded_registry = embedded_registry
+        if self.embedded_registry:
+            # Start the Middleware Registry in this process, it is listening
+            # once the constructor returns (port 0 picks a free port)
+            self.registry = SilKitRegistry(self.listen_uri)
+            self.listen_uri = self.registry.uri
+            port = self.registry.port
+            self.startup_timings["registry"] = time.perf_counter() - tmp
+        else:
+            # Start the Middleware Registry
+            self.mw_log = open("sil_kit_registry.log", "w")
+            self.middleware = subprocess.Popen(
+                [
+                    str(_base_path_ / "library/sil-kit-registry.exe"),
+                    "--listen-uri", self.listen_uri,
+                    "--log", "trace" # trace, debug, warn, info, error, critical or off
+                 ],
+                stdout=self.mw_log
+            )
+        self.port = port
+        #Participants created through add_participant share this configuration
+        self.single_host = single_host
+        if self.single_host:
+            self.participant_config = ParticipantConfiguration.single_host()
+        else:
+            self.participant_config = ParticipantConfiguration()
         self.sc_log = open("sil_kit_system_controller.log", "w")
         self.system_controller = subprocess.Popen(
             # Start the System Controller and tell it to wait for participants
@@ -32,6 +72,7 @@ class SilKit(object):
             ] + list(participants),
             stdout=self.sc_log
         )
+        components = {"SystemController": "system_controller"}
         self.launch_monitor = launch_monitor
         if self.launch_monitor:
             self.system_monitor = subprocess.Popen(
@@ -43,20 +84,57 @@ class SilKit(object):
                 ],
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
-        #Create a time master to provide timestamps
-        self.time_master = SilKitTimeMaster(port)
-        self.time_master.start()
+            components["SystemMonitor"] = "system_monitor"
+        if not self.embedded_registry:
+            self._wait_for_registry_(deadline)
+            self.startup_timings["registry"] = time.perf_counter() - tmp
+        #Unique per instance, a previous SilKit may not have been collected yet
+        self.observer = self.add_participant(f"SilKit_Orchestrator_{next(self.__counter__)}")
+        self.monitor = SilKitSystemMonitor(self.observer)
+        #Create a time master to provide timestamps, it publishes through the observer
+        self.time_master = SilKitTimeMaster(port, participant=self.observer, interval=time_sync_interval)
+        self.time_master.start(wait=False)
+        #New slaves converge faster while the master publishes at the fast rate
+        #The bound method keeps no reference to self, so SilKit is freed on del
+        self.monitor.connect_listeners.append(self.time_master.resync)
+        connected = self.monitor.wait_for(components, max(deadline - time.perf_counter(), 0.0))
+        for name, key in components.items():
+            self.startup_timings[key] = connected[name] - tmp
+        if not self.time_master.running.wait(max(deadline - time.perf_counter(), 0.0)):
+            raise RuntimeError("Could not start TimeMaster within timeout")
+        self.startup_timings["time_master"] = time.perf_counter() - tmp
+        self.startup_timings["total"] = time.perf_counter() - tmp
         print(f"Using SilKit {self.version()}")
 
+    def add_participant(self, name = None, **kwargs):
+        kwargs.setdefault("config", self.participant_config)
+        return SilKitParticipant(name, self.port, **kwargs)
+
+    def _wait_for_registry_(self, deadline):
+        uri = urllib.parse.urlsplit(self.listen_uri)
+        while True:
+            try:
+                with socket.create_connection((uri.hostname, uri.port), timeout=0.1):
+                    return
+            except OSError:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"Registry did not accept connections on {self.listen_uri}")
+                time.sleep(0.01)
 
     def __del__(self):
-        self.time_master.join()
-        if self.launch_monitor:
+        # __init__ may have failed part way, only stop what was started
+        if hasattr(self, "time_master"):
+            self.time_master.join()
+        if hasattr(self, "system_monitor"):
             self.system_monitor.terminate()
-        self.system_controller.terminate()
-        self.sc_log.close()
-        self.middleware.terminate()
-        self.mw_log.close()
+        if hasattr(self, "system_controller"):
+            self.system_controller.terminate()
+            self.sc_log.close()
+        if hasattr(self, "registry"):
+            del self.registry
+        if hasattr(self, "middleware"):
+            self.middleware.terminate()
+            self.mw_log.close()
 
     def version(self):
         major = ctypes.c_uint32()
@@ -45,10 +45,11 @@ class SilKitSubscriber(object):
             py2ct(self),
             self.on_msg_recv
         )
+        silkitapi.register_owner(self.instance, f"{participant.name}/{self.name}", participant.instance)
 
     @silkitapi.SilKit_DataMessageHandler_t
     @staticmethod
     @auto_context
     def _on_data_message(self, subscriber, event):
-        payload = event.contents.data.to_sequence()
+        payload = event.contents.data.to_bytes()
         print(f"[{self.name}] Received data: {payload}")
@@ -0,0 +1,84 @@
+import ctypes
+import threading
+import time
+
+from .library import silkitapi
+from .utilities import py2ct, auto_context
+
+class SilKitSystemMonitor(object):
+    @silkitapi.SilKit_SystemMonitor_ParticipantConnectedHandler_t
+    @staticmethod
+    @auto_context
+    def on_participant_connected(self, monitor, info):
+        self._set_connected_(info.contents.participantName.decode(), True)
+
+    @silkitapi.SilKit_SystemMonitor_ParticipantDisconnectedHandler_t
+    @staticmethod
+    @auto_context
+    def on_participant_disconnected(self, monitor, info):
+        self._set_connected_(info.contents.participantName.decode(), False)
+
+    def __init__(self, participant):
+        self.participant = participant
+        #Participant name -> perf_counter() of the moment it was seen connecting
+        self.connected = {}
+        #Called with the participant name whenever a participant connects
+        self.connect_listeners = []
+        self._condition = threading.Condition()
+        self.instance = silkitapi.SilKit_SystemMonitor_p()
+        silkitapi.SilKit_SystemMonitor_Create(
+            ctypes.byref(self.instance),
+            participant.instance
+        )
+        silkitapi.register_owner(self.instance, f"{participant.name}/SystemMonitor", participant.instance)
+        #Wrap self into ctypes
+        self.__self = py2ct(self)
+        silkitapi.SilKit_SystemMonitor_SetParticipantConnectedHandler(
+            self.instance,
+            self.__self,
+            self.on_participant_connected
+        )
+        silkitapi.SilKit_SystemMonitor_SetParticipantDisconnectedHandler(
+            self.instance,
+            self.__self,
+            self.on_participant_disconnected
+        )
+
+    def _set_connected_(self, name, connected):
+        with self._condition:
+            if connected:
+                if name in self.connected:
+                    return
+                self.connected[name] = time.perf_counter()
+            else:
+                self.connected.pop(name, None)
+            self._condition.notify_all()
+        if connected:
+            for listener in self.connect_listeners:
+                listener(name)
+
+    def is_connected(self, name: str):
+        result = silkitapi.SilKit_Bool()
+        silkitapi.SilKit_SystemMonitor_IsParticipantConnected(
+            self.instance,
+            name.encode(),
+            ctypes.byref(result)
+        )
+        return bool(result.value)
+
+    def wait_for(self, names, timeout: float = None):
+        # Returns the perf_counter() timestamps of the participants connecting
+        names = list(names)
+        #Participants that connected before the handler was set are only visible here
+        for name in names:
+            if name not in self.connected and self.is_connected(name):
+                self._set_connected_(name, True)
+        with self._condition:
+            ready = self._condition.wait_for(
+                lambda: all(name in self.connected for name in names),
+                timeout
+            )
+            if not ready:
+                missing = [name for name in names if name not in self.connected]
+                raise RuntimeError(f"Participants {missing} did not connect within {timeout}s")
+            return {name: self.connected[name] for name in names}
@@ -1,8 +1,7 @@
 import enum
-import multiprocessing
 import struct
+import threading
 import time
-import datetime
 
 from typing import Optional
 
@@ -15,64 +14,93 @@ class TimeMasterState(enum.IntEnum):
     RUNNING = 2
     EXITED = 3
 
-class SilKitTimeMaster(multiprocessing.Process):
+class SilKitTimeMaster(threading.Thread):
+    # Publishes the time from a thread of this process. The publisher is
+    # added to the given host participant, only without one a dedicated
+    # participant is created.
     def __init__(
         self,
         port = 8500,
         *,
+        participant = None,
+        interval = 1.0,
+        min_interval = 0.05,
         timeout = 5.0
     ):
         super(SilKitTimeMaster, self).__init__(
             group = None,
             target = None,
-            name = f"{self.__class__.__name__}Process",
+            name = f"{self.__class__.__name__}Thread",
             args = (),
             kwargs = {},
-            daemon = False
+            daemon = True
         )
         self.timeout = timeout
+        #Publishes every min_interval after (re)sync and backs off to interval
+        self.interval = interval
+        self.min_interval = min(min_interval, interval)
+        self.current_interval = self.min_interval
         self.__active = None
-        self.state = multiprocessing.Value("b", TimeMasterState.INIT)
+        self.state = TimeMasterState.INIT
         self.port = port
-        self.exit_flag = multiprocessing.Value("b", 0)
+        self.participant = participant
+        self.publisher = None
+        self.exit_flag = threading.Event()
+        self.running = threading.Event()
+        self._wakeup = threading.Event()
 
-    def start(self):
+    def start(self, wait: bool = True):
         if self.__active is None:
             self.__active = True
+            self.state = TimeMasterState.STARTED
+            if self.participant is None:
+                self.participant = SilKitParticipant("SilKit_TimeMaster", self.port)
+            self.participant.add_publisher(
+                "TIME_MASTER", "GLOBAL_SYNC_TIME", media_type="application/octet-stream", history=True, INSTANCE="TIME_SYNC_1S"
+            )
+            self.publisher = self.participant.publisher("TIME_MASTER")
             super(SilKitTimeMaster, self).start()
-            self.state.value = TimeMasterState.STARTED
-            tmp = time.perf_counter()
-            while not self.is_running():
-                if time.perf_counter() - tmp > self.timeout:
-                    self.state.value = TimeMasterState.ERROR
-                    self.join()
-                    raise RuntimeError("Could not start TimeMaster within timeout")
-                time.sleep(0.1)
+            if not wait:
+                return
+            if not self.running.wait(self.timeout):
+                self.state = TimeMasterState.ERROR
+                self.join()
+                raise RuntimeError("Could not start TimeMaster within timeout")
 
     def join(self, timeout=None):
         if self.__active:
-            self.exit_flag.value = 1
+            self.exit_flag.set()
+            self._wakeup.set()
             self.__active = False
             super(SilKitTimeMaster, self).join(timeout)
         elif self.__active is None:
             raise OSError(f"{self.__class__.__name__} not started yet")
 
+    def resync(self, name: Optional[str] = None):
+        # Publish at the fast rate again, e.g. because the participant name
+        # connected. Only wakes the thread, the rate is reset by the loop.
+        self._wakeup.set()
+
     def is_running(self):
-        return self.state.value != TimeMasterState.RUNNING
+        return self.state == TimeMasterState.RUNNING
 
     def run(self):
-        self.state.value = TimeMasterState.RUNNING
-        time_master = SilKitParticipant("SilKit_TimeMaster", self.port)
-        time_master.add_publisher(
-            "TIME_MASTER", "GLOBAL_SYNC_TIME", media_type="application/octet-stream", history=True, INSTANCE="TIME_SYNC_1S"
-        )
         # The time master periodically send the date when it was first started
-        # and the time in seconds since then
-        boot_timestamp = time.perf_counter()
-        boot_date = datetime.datetime.now(datetime.timezone.utc).timestamp()
-        while self.exit_flag.value == 0:
-            time_since_boot = time.perf_counter() - boot_timestamp
-            data = struct.pack("dd", boot_date, time_since_boot)
-            time_master.publisher("TIME_MASTER").publish(data)
-            time.sleep(1)
-        self.state.value = TimeMasterState.EXITED
+        # and the time since then, both in integer nanoseconds
+        boot_timestamp = time.perf_counter_ns()
+        boot_date = time.time_ns()
+        self.state = TimeMasterState.RUNNING
+        interval = self.min_interval
+        while not self.exit_flag.is_set():
+            time_since_boot = time.perf_counter_ns() - boot_timestamp
+            data = struct.pack("qq", boot_date, time_since_boot)
+            self.publisher.publish(data)
+            self.running.set()
+            self.current_interval = interval
+            if self._wakeup.wait(interval):
+                #Resynced, publish right away and back off from the fast rate again
+                self._wakeup.clear()
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.interval)
+        self.state = TimeMasterState.EXITED
@@ -1,4 +1,6 @@
+import collections
 import struct
+import threading
 import time
 
 from typing import Optional
@@ -14,12 +16,26 @@ class SilKitTimeSlave(SilKitSubscriber):
         participant,
         name:str,
         *,
-        timeout = 5.0
+        timeout = 5.0,
+        window = 16,
+        max_skew = 500e-6,
+        max_latency = 2e-3
     ):
         self.master_time_since_boot = None
         self.master_boot_date = None
         self.slave_sync_time = None
+        #Estimate of master time = local + offset + skew * (local - reference)
         self.offset = None
+        self.skew = 0.0
+        self.reference = None
+        #(master time at reference, reference, skew), replaced as a whole by
+        #the sync handler so readers on other threads never see a torn update
+        self._sync_ = None
+        self.max_skew = max_skew
+        #Latency jitter of the fastest samples, limits the resolvable skew
+        self.max_latency = int(max_latency * 1e9)
+        self.samples = collections.deque(maxlen=window)
+        self.synced = threading.Event()
         super(SilKitTimeSlave, self).__init__(
             participant,
             f"TIME_SLAVE_{name}",
@@ -29,21 +45,62 @@ class SilKitTimeSlave(SilKitSubscriber):
             INSTANCE="TIME_SYNC_1S"
         )
         #Wait until synced
-        tmp = time.perf_counter()
-        while self.slave_sync_time is None:
-            if time.perf_counter() - tmp > timeout:
-                raise RuntimeError("Did not receive a sync message within the specified timeout.")
-            time.sleep(0.1)
+        if not self.synced.wait(timeout):
+            raise RuntimeError("Did not receive a sync message within the specified timeout.")
 
     @silkitapi.SilKit_DataMessageHandler_t
     @staticmethod
     @auto_context
     def on_msg_recv(self, subscriber, event):
         #The time slave periodically receives the time from the master
-        self.slave_sync_time = time.perf_counter()
-        payload = event.contents.data.to_sequence()
-        self.master_boot_date, self.master_time_since_boot = struct.unpack("dd", bytes(payload))
+        self.slave_sync_time = time.perf_counter_ns()
+        payload = event.contents.data.to_memoryview()
+        self.master_boot_date, self.master_time_since_boot = struct.unpack("qq", payload)
+        self.samples.append((self.slave_sync_time, self.master_boot_date + self.master_time_since_boot))
+        self._estimate_()
+        self.synced.set()
+
+    def _estimate_(self):
+        # Every sample's offset is reduced by its transport latency, so the
+        # master time is the upper envelope of the offsets. A sample that is
+        # further below the envelope than max_latency for every admissible
+        # skew arrived late (e.g. the history replay a new subscriber gets
+        # first) and is left out, the skew is the least squares slope of the
+        # remaining samples.
+        reference, master_reference = self.samples[-1]
+        base = master_reference - reference
+        points = [(local - reference, master - local - base) for local, master in self.samples]
+        slopes = [self.max_skew * step / 4 for step in range(-4, 5)]
+        envelopes = [max(y - slope * x for x, y in points) for slope in slopes]
+        points = [
+            (x, y) for x, y in points
+            if min(envelope - (y - slope * x) for slope, envelope in zip(slopes, envelopes)) <= self.max_latency
+        ]
+        #Over a short span the latency jitter dominates the slope, until the
+        #skew can be resolved it is taken as 0 and only the recent samples,
+        #over which an unknown skew drifts less than the jitter, are used
+        horizon = self.max_latency / self.max_skew
+        skew = 0.0
+        if points[-1][0] - points[0][0] < horizon:
+            points = [(x, y) for x, y in points if x >= -horizon / 2]
+        else:
+            skew = max(-self.max_skew, min(self.max_skew, self._fit_slope_(points)))
+        shift = max(y - skew * x for x, y in points)
+        self.skew = skew
+        self.reference = reference
+        self.offset = base + int(shift)
+        self._sync_ = (reference + self.offset, reference, skew)
+
+    @staticmethod
+    def _fit_slope_(points):
+        count = len(points)
+        mean_x = sum(x for x, _ in points) / count
+        mean_y = sum(y for _, y in points) / count
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
 
     def get_timestamp(self):
-        elapsed_local_time = time.perf_counter() - self.slave_sync_time
-        return self.master_boot_date + self.master_time_since_boot + elapsed_local_time
+        # Nanoseconds since the epoch
+        master_reference, reference, skew = self._sync_
+        elapsed = time.perf_counter_ns() - reference
+        return master_reference + elapsed + int(skew * elapsed)
@@ -0,0 +1,88 @@
+import ctypes
+
+from .library import silkitapi
+from .utilities import py2ct, auto_context
+
+class SilKitTimeSync(object):
+    @silkitapi.SilKit_TimeSyncService_SimulationStepHandler_t
+    @staticmethod
+    @auto_context
+    def on_simulation_step(self, time_sync_service, now, duration):
+        #now and duration are the virtual time in nanoseconds
+        self.last_step = now
+        if self.handler is not None:
+            self.handler(now, duration)
+
+    def __init__(
+        self,
+        participant,
+        step_size: int = 1000000,
+        handler = None,
+        *,
+        asynchronous: bool = False,
+        operation_mode: silkitapi.SilKitOperationMode = silkitapi.SilKitOperationMode.COORDINATED
+    ):
+        self.participant = participant
+        self.step_size = step_size # nanoseconds
+        self.handler = handler
+        self.asynchronous = asynchronous
+        self.last_step = None
+        #A participant owns a single lifecycle service, the time sync service is bound to it
+        self.lifecycle_config = silkitapi.SilKit_LifecycleConfiguration(
+            structHeader=silkitapi.SilKit_StructHeader(
+                version=silkitapi.SilKit_STRUCT_VERSION.LifecycleConfiguration
+            ),
+            operationMode=operation_mode
+        )
+        self.lifecycle_service = silkitapi.SilKit_LifecycleService_p()
+        silkitapi.SilKit_LifecycleService_Create(
+            ctypes.byref(self.lifecycle_service),
+            participant.instance,
+            ctypes.byref(self.lifecycle_config)
+        )
+        silkitapi.register_owner(self.lifecycle_service, f"{participant.name}/LifecycleService", participant.instance)
+        self.instance = silkitapi.SilKit_TimeSyncService_p()
+        silkitapi.SilKit_TimeSyncService_Create(
+            ctypes.byref(self.instance),
+            self.lifecycle_service
+        )
+        silkitapi.register_owner(self.instance, f"{participant.name}/TimeSyncService", participant.instance)
+        #Wrap self into ctypes
+        self.__self = py2ct(self)
+        if self.asynchronous:
+            # The step only ends once complete_step is called
+            set_handler = silkitapi.SilKit_TimeSyncService_SetSimulationStepHandlerAsync
+        else:
+            set_handler = silkitapi.SilKit_TimeSyncService_SetSimulationStepHandler
+        set_handler(
+            self.instance,
+            self.__self,
+            self.on_simulation_step,
+            self.step_size
+        )
+
+    def complete_step(self):
+        silkitapi.SilKit_TimeSyncService_CompleteSimulationStep(self.instance)
+
+    def now(self):
+        now = silkitapi.SilKit_NanosecondsTime()
+        silkitapi.SilKit_TimeSyncService_Now(self.instance, ctypes.byref(now))
+        return now.value
+
+    def start(self):
+        silkitapi.SilKit_LifecycleService_StartLifecycle(self.lifecycle_service)
+
+    def stop(self, reason: str = "Stopped by user"):
+        silkitapi.SilKit_LifecycleService_Stop(self.lifecycle_service, reason.encode())
+
+    def report_error(self, text: str):
+        silkitapi.SilKit_LifecycleService_ReportError(self.lifecycle_service, text.encode())
+
+    def wait(self):
+        #Blocks until the lifecycle of the participant has finished
+        state = silkitapi.SilKit_ParticipantState()
+        silkitapi.SilKit_LifecycleService_WaitForLifecycleToComplete(
+            self.lifecycle_service,
+            ctypes.byref(state)
+        )
+        return silkitapi.SilKitParticipantState(state.value)
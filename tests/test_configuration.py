@@ -0,0 +1,16 @@
+from pysilkit.configuration import ParticipantConfiguration, LogSink, SinkType
+from pysilkit.library.silkitapi import SilKitLoggingLevel
+
+def test_flush_level_follows_log_level():
+    config = ParticipantConfiguration(log_level=SilKitLoggingLevel.WARN)
+    assert config.flush_level == SilKitLoggingLevel.WARN
+
+def test_flush_level_follows_sinks():
+    sinks = [LogSink(SinkType.STDOUT, SilKitLoggingLevel.DEBUG), LogSink(SinkType.FILE, SilKitLoggingLevel.ERROR)]
+    config = ParticipantConfiguration(sinks=sinks, log_level=SilKitLoggingLevel.WARN)
+    assert config.flush_level == SilKitLoggingLevel.DEBUG
+    assert "  FlushLevel: Debug" in config.to_yaml("Test", "silkit://localhost:8500").splitlines()
+
+def test_flush_level_explicit():
+    config = ParticipantConfiguration(flush_level=SilKitLoggingLevel.ERROR)
+    assert config.flush_level == SilKitLoggingLevel.ERROR
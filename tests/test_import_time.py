@@ -0,0 +1,53 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+_src_ = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+# Cumulative import time of 'from pysilkit import CanMessage' in
+# microseconds, about 30ms on a desktop machine
+BUDGET = int(os.environ.get("PYSILKIT_IMPORT_BUDGET_US", 150000))
+FORBIDDEN = ("pysilkit.silkit", "subprocess", "multiprocessing")
+
+def _import_times_(statement):
+    # Returns [(cumulative, module, level)] as reported by -X importtime and
+    # the modules loaded at the end. Modules loaded through importlib, like
+    # the lazy exports, are not reported themselves, only their imports.
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_src_), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            f"{statement}\nimport sys\nprint(*sys.modules)"
+        ],
+        env=env, capture_output=True, text=True, check=True
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip())) // 2
+        times.append((int(cumulative), name.strip(), level))
+    return times, set(result.stdout.split())
+
+def _package_import_time_(times):
+    # The modules imported before pysilkit belong to the interpreter start up
+    names = [name for _, name, _ in times]
+    start = names.index("pysilkit")
+    return sum(cumulative for cumulative, _, level in times[start:] if level == 0)
+
+def test_can_message_skips_orchestration():
+    _, imported = _import_times_("from pysilkit import CanMessage")
+    assert "pysilkit.can_controller" in imported
+    for module in FORBIDDEN:
+        assert module not in imported, f"{module} was imported"
+
+def test_can_message_import_budget():
+    # The best of a few runs, a single run is easily disturbed
+    total = min(
+        _package_import_time_(_import_times_("from pysilkit import CanMessage")[0])
+        for _ in range(3)
+    )
+    assert total <= BUDGET, f"Importing CanMessage took {total}us, the budget is {BUDGET}us"
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from pysilkit.message_queue import MessageQueue, OverflowPolicy
+
+def _fill_(queue, items):
+    return [queue.put(item) for item in items]
+
+def test_drop_oldest():
+    queue = MessageQueue(3, OverflowPolicy.DROP_OLDEST)
+    assert _fill_(queue, range(5)) == [True] * 5
+    assert [queue.get() for _ in range(3)] == [2, 3, 4]
+    assert queue.stats() == {"size": 0, "maxlen": 3, "enqueued": 5, "dequeued": 3, "dropped": 2}
+
+def test_drop_newest():
+    queue = MessageQueue(3, OverflowPolicy.DROP_NEWEST)
+    assert _fill_(queue, range(5)) == [True, True, True, False, False]
+    assert [queue.get() for _ in range(3)] == [0, 1, 2]
+    assert queue.stats() == {"size": 0, "maxlen": 3, "enqueued": 3, "dequeued": 3, "dropped": 2}
+
+def test_block():
+    queue = MessageQueue(2, OverflowPolicy.BLOCK)
+    _fill_(queue, range(2))
+    producer = threading.Thread(target=queue.put, args=(2,))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+    assert queue.get() == 0
+    producer.join(1.0)
+    assert not producer.is_alive()
+    assert [queue.get() for _ in range(2)] == [1, 2]
+    assert queue.stats() == {"size": 0, "maxlen": 2, "enqueued": 3, "dequeued": 3, "dropped": 0}
+
+@pytest.mark.parametrize("overflow", list(OverflowPolicy))
+def test_zero_capacity(overflow):
+    queue = MessageQueue(0, overflow)
+    assert _fill_(queue, range(3)) == [False] * 3
+    assert len(queue) == 0
+    assert queue.stats() == {"size": 0, "maxlen": 0, "enqueued": 0, "dequeued": 0, "dropped": 3}
+
+def test_unbounded():
+    queue = MessageQueue(None)
+    assert all(_fill_(queue, range(5000)))
+    assert len(queue) == 5000
+    assert queue.dropped == 0
+
+def test_get_timeout():
+    queue = MessageQueue()
+    with pytest.raises(IndexError):
+        queue.get()
+    with pytest.raises(IndexError):
+        queue.get(0.05)
+    assert queue.dequeued == 0
+
+def test_clear():
+    queue = MessageQueue(5)
+    _fill_(queue, range(4))
+    queue.clear()
+    assert len(queue) == 0
+    assert queue.dropped == 4
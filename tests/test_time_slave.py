@@ -0,0 +1,69 @@
+import collections
+import random
+
+from pysilkit.time_slave import SilKitTimeSlave
+
+OFFSET = 1_700_000_000_000_000_000 # master time at local time 0
+
+def _slave_(window = 16):
+    # Only the estimator, without subscribing to a time master
+    slave = SilKitTimeSlave.__new__(SilKitTimeSlave)
+    slave.samples = collections.deque(maxlen=window)
+    slave.max_skew = 500e-6
+    slave.max_latency = 2_000_000
+    slave.skew = 0.0
+    return slave
+
+def _master_(skew):
+    return lambda local: OFFSET + local + int(skew * local)
+
+def _predict_(slave, local):
+    master_reference, reference, skew = slave._sync_
+    elapsed = local - reference
+    return master_reference + elapsed + int(skew * elapsed)
+
+def _run_(slave, master, count, *, late = None, seed = 1):
+    # Feeds samples on the master's back off schedule with 0-2ms latency and
+    # returns the prediction errors 1s after every sample in milliseconds
+    rnd = random.Random(seed)
+    local = 10_000_000_000
+    if late is not None:
+        slave.samples.append((local, master(local - late)))
+        slave._estimate_()
+    interval = 50_000_000
+    errors = []
+    for _ in range(count):
+        local += interval
+        interval = min(interval * 2, 1_000_000_000)
+        slave.samples.append((local, master(local - rnd.randint(0, 2_000_000))))
+        slave._estimate_()
+        query = local + 1_000_000_000
+        errors.append((_predict_(slave, query) - master(query)) / 1e6)
+    return errors
+
+def test_single_sample():
+    slave = _slave_()
+    master = _master_(0.0)
+    slave.samples.append((5_000_000_000, master(5_000_000_000)))
+    slave._estimate_()
+    assert slave.skew == 0.0
+    assert _predict_(slave, 6_000_000_000) == master(6_000_000_000)
+
+def test_converges_with_skew():
+    for skew in (0.0, 200e-6, -450e-6):
+        slave = _slave_()
+        errors = _run_(slave, _master_(skew), 30)
+        assert max(abs(error) for error in errors[12:]) < 1.5
+        assert abs(slave.skew - skew) < 100e-6
+
+def test_late_sample_is_ignored():
+    # The history replay a late joining slave receives first is up to the
+    # master's interval old, it must not tilt the skew
+    for skew in (0.0, 100e-6, -300e-6):
+        for seed in range(5):
+            master = _master_(skew)
+            reference = _run_(_slave_(), master, 12, seed=seed)
+            slave = _slave_()
+            errors = _run_(slave, master, 12, late=900_000_000, seed=seed)
+            assert errors[1:] == reference[1:]
+            assert max(abs(error) for error in errors[6:]) < 1.5